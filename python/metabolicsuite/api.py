@@ -6,12 +6,14 @@ native solvers (Gurobi, CPLEX, HiGHS via COBRApy).
 
 Endpoints:
 - /solve/fba - Flux Balance Analysis
+- /solve/fba_sweep - FBA over many scenarios on one warm solver
 - /solve/pfba - Parsimonious FBA
 - /solve/fva - Flux Variability Analysis
 - /solve/moma - Minimization of Metabolic Adjustment
 - /solve/gimme - Gene Inactivity Moderated by Metabolism and Expression
 - /solve/imat - Integrative Metabolic Analysis Tool (true MILP)
 - /solve/eflux - Expression-based Flux scaling
+- /model/register - Upload a model once, get a model_token
 - /model/info - Get model statistics
 - /model/validate - Validate model structure
 
@@ -21,15 +23,52 @@ References:
 - Becker & Palsson (2008) "Context-specific networks" PLoS Comput Biol
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pydantic import BaseModel, Field
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
+import os
+import re
+import string
+import threading
+import time
+
+import numpy as np
+
+from .solvers import set_solver
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# FVA parallelism: each worker process should get at least this many reactions,
+# otherwise pool startup and model pickling outweigh the LP work.
+# METABOLICSUITE_FVA_PROCESSES caps the worker count (default: all cores).
+FVA_MIN_REACTIONS_PER_PROCESS = 64
+
+# Number of parsed models kept in memory for reuse across requests
+MODEL_CACHE_SIZE = int(os.environ.get("METABOLICSUITE_MODEL_CACHE_SIZE", "16"))
+
+# Default LP/MILP solver for all models (falls back to GLPK when unavailable).
+# optlang exposes HiGHS as its "hybrid" interface; "highs" is accepted as an alias.
+DEFAULT_SOLVER = os.environ.get("METABOLICSUITE_SOLVER", "highs")
+SOLVER_ALIASES = {"highs": "hybrid"}
+SOLVER_PATTERN = "^(glpk|highs|hybrid|cplex|gurobi)$"
+
 
 # ============================================================================
 # Pydantic Models for Request/Response
@@ -44,37 +83,59 @@ class ModelData(BaseModel):
     genes: Optional[List[Dict[str, Any]]] = []
     objective: Optional[str] = None
 
+class ModelToken(BaseModel):
+    """Reference to a model previously uploaded via /model/register"""
+    model_token: str
+
 class FBARequest(BaseModel):
     """FBA request with model and constraints"""
-    model: ModelData
+    model: Union[ModelData, ModelToken]
     constraints: Optional[Dict[str, Dict[str, float]]] = None
     knockouts: Optional[List[str]] = []
     objective: Optional[str] = None
+    warm_start: bool = True  # Solve on the model's persistent solver session (False = fresh copy)
+    solver: Optional[str] = Field(default=None, pattern=SOLVER_PATTERN)  # None = server default
+
+class FBAScenario(BaseModel):
+    """One set of constraint deltas within an FBA sweep"""
+    constraints: Optional[Dict[str, Dict[str, float]]] = None
+    knockouts: Optional[List[str]] = []
+    objective: Optional[str] = None
+
+class FBASweepRequest(BaseModel):
+    """Sequence of FBA scenarios solved on one warm solver"""
+    model: Union[ModelData, ModelToken]
+    scenarios: List[FBAScenario]
+    solver: Optional[str] = Field(default=None, pattern=SOLVER_PATTERN)  # None = server default
 
 class FVARequest(BaseModel):
     """FVA request with options"""
-    model: ModelData
+    model: Union[ModelData, ModelToken]
     constraints: Optional[Dict[str, Dict[str, float]]] = None
     knockouts: Optional[List[str]] = []
     fraction_of_optimum: float = Field(default=0.9, ge=0.0, le=1.0)
     reactions: Optional[List[str]] = None  # None = all reactions
+    processes: Optional[int] = Field(default=None, ge=1)  # None = auto
+    solver: Optional[str] = Field(default=None, pattern=SOLVER_PATTERN)  # None = server default
 
 class OmicsRequest(BaseModel):
     """Omics integration request (GIMME, iMAT, E-Flux)"""
-    model: ModelData
+    model: Union[ModelData, ModelToken]
     expression: Dict[str, float]  # gene_id -> expression value
     method: str = Field(default="eflux", pattern="^(gimme|imat|eflux|made)$")
     threshold: Optional[float] = 0.25
     high_threshold: Optional[float] = 0.75
     low_threshold: Optional[float] = 0.25
     required_fraction: Optional[float] = 0.9
+    solver: Optional[str] = Field(default=None, pattern=SOLVER_PATTERN)  # None = server default
 
 class MOMARequest(BaseModel):
     """MOMA request with reference flux"""
-    model: ModelData
+    model: Union[ModelData, ModelToken]
     constraints: Optional[Dict[str, Dict[str, float]]] = None
     knockouts: Optional[List[str]] = []
     reference_fluxes: Optional[Dict[str, float]] = None
+    solver: Optional[str] = Field(default=None, pattern=SOLVER_PATTERN)  # None = server default
 
 class SolverResponse(BaseModel):
     """Standard response for solver results"""
@@ -88,6 +149,20 @@ class SolverResponse(BaseModel):
     solve_time: Optional[float] = None
     error: Optional[str] = None
 
+# Optional SolverResponse fields, for building response payloads without the model
+SOLVER_RESPONSE_DEFAULTS = {
+    name: field.get_default()
+    for name, field in SolverResponse.model_fields.items()
+    if not field.is_required()
+}
+
+class FBASweepResponse(BaseModel):
+    """Per-scenario results of an FBA sweep"""
+    status: str
+    results: List[SolverResponse] = []
+    solve_time: Optional[float] = None
+    error: Optional[str] = None
+
 class FVAResponse(BaseModel):
     """FVA-specific response with min/max ranges"""
     status: str
@@ -108,6 +183,181 @@ class ModelInfoResponse(BaseModel):
     subsystems: List[str]
 
 
+# ============================================================================
+# Model Cache
+# ============================================================================
+
+def solver_name(solver: Optional[str]) -> Optional[str]:
+    """optlang interface name for a requested solver (None keeps the current one)"""
+    if solver is None:
+        return None
+    return SOLVER_ALIASES.get(solver, solver)
+
+
+def use_solver(model, solver: Optional[str] = None):
+    """
+    Put model on the requested solver.
+
+    Switching interfaces rebuilds the whole optlang problem, so the model is
+    only touched when it is not already on that solver.
+    """
+    name = solver_name(solver)
+    if name is not None:
+        set_solver(model, name)
+    return model
+
+
+def configure_default_solver(preferred: str = DEFAULT_SOLVER) -> str:
+    """Make preferred the solver of newly built models, falling back to GLPK"""
+    import cobra
+    from cobra.exceptions import SolverNotFound
+    from cobra.util.solver import interface_to_str
+
+    config = cobra.Configuration()
+    for name in (preferred, "glpk"):
+        try:
+            config.solver = solver_name(name)
+            break
+        except SolverNotFound:
+            logger.warning(f"Solver '{name}' is not available")
+    return interface_to_str(config.solver)
+
+
+def warm_up_solver():
+    """
+    Solve a two-reaction model once.
+
+    The first LP pays for building solver interface objects and symbolic
+    expression machinery; doing it at startup keeps it out of the first
+    request's latency.
+    """
+    import cobra
+    from cobra.flux_analysis import pfba
+
+    model = cobra.Model("warmup")
+    met = cobra.Metabolite("a_c", compartment="c")
+    uptake = cobra.Reaction("EX_a_c", lower_bound=-10.0, upper_bound=0.0)
+    uptake.add_metabolites({met: -1.0})
+    demand = cobra.Reaction("DM_a_c", lower_bound=0.0, upper_bound=1000.0)
+    demand.add_metabolites({met: -1.0})
+    model.add_reactions([uptake, demand])
+    model.objective = demand
+
+    model.optimize()
+    pfba(model)
+
+
+@dataclass
+class CachedModel:
+    """A parsed template model plus data derived from it once per model"""
+    token: str
+    model: Any
+    gprs: Optional["CompiledGPRs"] = None
+    wild_type_fluxes: Optional[Any] = None  # pandas Series from an unconstrained FBA
+    info: Optional[ModelInfoResponse] = None
+
+    def compiled_gprs(self) -> "CompiledGPRs":
+        """GPR programs for every reaction, compiled on first use"""
+        if self.gprs is None:
+            self.gprs = compile_gprs(self.model)
+        return self.gprs
+
+    def model_info(self) -> ModelInfoResponse:
+        """Model statistics, computed on first use (the template never changes)"""
+        if self.info is None:
+            model = self.model
+            compartments = set()
+            for met in model.metabolites:
+                compartments.add(met.compartment)
+            subsystems = set()
+            for rxn in model.reactions:
+                if rxn.subsystem:
+                    subsystems.add(rxn.subsystem)
+
+            self.info = ModelInfoResponse(
+                id=model.id,
+                name=model.name,
+                num_reactions=len(model.reactions),
+                num_metabolites=len(model.metabolites),
+                num_genes=len(model.genes),
+                objective=str(model.objective.expression) if model.objective else None,
+                compartments=sorted(compartments),
+                subsystems=sorted(subsystems),
+            )
+        return self.info
+
+
+class ModelCache:
+    """
+    Content-addressed LRU cache of parsed COBRApy models.
+
+    Models are keyed on a blake2b digest of the canonical request JSON, so
+    scenario sweeps that upload the same model repeatedly only parse it once.
+    The digest doubles as the model_token handed out by /model/register.
+    Cached models are templates: callers must work on a copy.
+    """
+
+    def __init__(self, maxsize: int = MODEL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._models: "OrderedDict[str, CachedModel]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(data: ModelData) -> str:
+        """Stable content hash of a model upload"""
+        payload = json.dumps(data.model_dump(), sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, token: str) -> Optional[CachedModel]:
+        """Return the cached entry for token, or None"""
+        with self._lock:
+            entry = self._models.get(token)
+            if entry is not None:
+                self._models.move_to_end(token)
+            return entry
+
+    def put(self, entry: CachedModel) -> None:
+        """Insert an entry, evicting the least recently used one if full"""
+        with self._lock:
+            self._models[entry.token] = entry
+            self._models.move_to_end(entry.token)
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+
+
+class SolverSessionRegistry:
+    """
+    Long-lived COBRApy models keyed by model_token.
+
+    Each session owns a private copy of the cached model whose optlang problem
+    is never rebuilt, so consecutive solves restart from the previous simplex
+    basis. Sessions are only mutated inside ``with model:`` so cobra's history
+    restores bounds and objective after every solve.
+    """
+
+    def __init__(self, maxsize: int = MODEL_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._sessions: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def session(self, token: str, template, solver: Optional[str] = None):
+        """Yield the session model for token, creating it from template if needed"""
+        key = (token, solver_name(solver))
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = (use_solver(template.copy(), solver), threading.Lock())
+                self._sessions[key] = entry
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+
+        model, lock = entry
+        with lock, model:
+            yield model
+
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
@@ -117,13 +367,53 @@ def create_app():
     try:
         from fastapi import FastAPI, HTTPException
         from fastapi.middleware.cors import CORSMiddleware
+        from fastapi.responses import JSONResponse
     except ImportError:
         raise ImportError(
             "FastAPI is required for the API server. "
             "Install with: pip install metabolicsuite[server]"
         )
 
+    try:
+        import cobra
+        import pandas as pd
+        from cobra.flux_analysis import flux_variability_analysis, moma, pfba
+        from cobra.io.dict import model_from_dict as cobra_model_from_dict
+        from cobra.util.solver import fix_objective_as_constraint, interface_to_str
+        from optlang.symbolics import Zero, add
+    except ImportError:
+        raise ImportError(
+            "COBRApy is required for the API server. "
+            "Install with: pip install metabolicsuite[server]"
+        )
+
+    class ORJSONResponse(JSONResponse):
+        """JSON response rendered by orjson (native float and numpy encoding)"""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(
+                content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+
+    # orjson serializes large flux dicts several times faster than stdlib json
+    response_class = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+    # Full benchmark runs go to a worker process so they neither block the
+    # event loop nor contend for the GIL with request handling. One worker:
+    # concurrent runs queue instead of oversubscribing the cores. The worker
+    # process is only started by the first submission.
+    benchmark_executor = ProcessPoolExecutor(max_workers=1)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # Pay the import/first-solve cost before accepting requests
+        warm_up_solver()
+        yield
+        benchmark_executor.shutdown(wait=False)
+
     app = FastAPI(
+        default_response_class=response_class,
+        lifespan=lifespan,
         title="MetabolicSuite Compute API",
         description="Backend API for constraint-based metabolic modeling",
         version="0.1.0",
@@ -140,21 +430,18 @@ def create_app():
         allow_headers=["*"],
     )
 
+    logger.info(f"Default solver: {configure_default_solver()}")
+
+    model_cache = ModelCache()
+    solver_sessions = SolverSessionRegistry()
+
     # ========================================================================
     # Helper Functions
     # ========================================================================
 
-    def model_from_dict(data: ModelData):
+    def parse_model(data: ModelData):
         """Convert request model to COBRApy model"""
-        try:
-            import cobra
-        except ImportError:
-            raise HTTPException(
-                status_code=500,
-                detail="COBRApy is required. Install with: pip install cobra"
-            )
-
-        # Convert to JSON-compatible dict for cobra.io.from_json
+        # Convert to the dict layout cobra's JSON reader expects
         model_dict = {
             "id": data.id,
             "name": data.name or data.id,
@@ -163,9 +450,9 @@ def create_app():
             "genes": data.genes or [],
         }
 
-        # Use cobra's JSON parser
-        model_json = json.dumps(model_dict)
-        model = cobra.io.from_json(model_json)
+        # The request body is already decoded; build the model straight from
+        # the dict instead of dumping it to a JSON string and parsing it back
+        model = cobra_model_from_dict(model_dict)
 
         # Set objective if specified
         if data.objective and data.objective in model.reactions:
@@ -173,25 +460,183 @@ def create_app():
 
         return model
 
-    def apply_constraints(model, constraints: Dict, knockouts: List[str]):
-        """Apply constraints and knockouts to model"""
+    def cached_model(data: Union[ModelData, ModelToken]) -> CachedModel:
+        """
+        Return the cache entry for a request model, parsing on a miss.
+
+        An unknown model_token raises HTTPException(404); endpoints re-raise it
+        ahead of their generic error handler so clients see the status code.
+        """
+        if isinstance(data, ModelToken):
+            entry = model_cache.get(data.model_token)
+            if entry is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Unknown model_token '{data.model_token}'. Register the model again."
+                )
+            return entry
+
+        token = ModelCache.digest(data)
+        entry = model_cache.get(token)
+        if entry is None:
+            entry = CachedModel(token=token, model=parse_model(data))
+            model_cache.put(entry)
+        return entry
+
+    @contextmanager
+    def request_model(entry: CachedModel, warm_start: bool = False, solver: Optional[str] = None):
+        """
+        Yield the model a request should solve on.
+
+        With warm_start the model's solver session is reused and every change
+        made inside the block is reverted on exit; otherwise a private copy.
+        """
+        if warm_start:
+            with solver_sessions.session(entry.token, entry.model, solver) as model:
+                yield model
+        else:
+            yield use_solver(entry.model.copy(), solver)
+
+    def series_to_dict(values) -> Dict[str, float]:
+        """
+        Convert a cobra Solution series to a plain dict of Python floats.
+
+        Solution series are already indexed by reaction/metabolite id in model
+        order, so one C-level tolist() replaces a pandas lookup per entry.
+        """
+        return dict(zip(values.index, values.tolist()))
+
+    def solver_payload(**fields) -> Dict[str, Any]:
+        """SolverResponse-shaped plain dict (unset fields take their defaults)"""
+        payload = dict(SOLVER_RESPONSE_DEFAULTS)
+        payload.update(fields)
+        return payload
+
+    def solver_result(model, method: str, solution, solve_time: float):
+        """
+        Successful solver result as a ready-made JSON response.
+
+        Genome-scale flux dicts have thousands of entries; returning a
+        Response directly skips pydantic validating and re-encoding each
+        float. Endpoints keep response_model=SolverResponse for the schema.
+        """
+        return response_class(content=solver_payload(
+            status=solution.status,
+            objective_value=solution.objective_value,
+            fluxes=series_to_dict(solution.fluxes),
+            method=method,
+            solver=interface_to_str(model.problem),
+            solve_time=solve_time,
+        ))
+
+    def fba_payload(model, solution, method: str, solve_time: float) -> Dict[str, Any]:
+        """Package an FBA-style solution with fluxes and dual values"""
+        return solver_payload(
+            status=solution.status,
+            objective_value=solution.objective_value,
+            fluxes=series_to_dict(solution.fluxes),
+            shadow_prices=series_to_dict(solution.shadow_prices),
+            reduced_costs=series_to_dict(solution.reduced_costs),
+            method=method,
+            solver=interface_to_str(model.problem),
+            solve_time=solve_time,
+        )
+
+    def apply_constraints(
+        model,
+        constraints: Dict,
+        knockouts: List[str],
+        gprs: Optional["CompiledGPRs"] = None,
+    ):
+        """
+        Apply constraints and knockouts to model
+
+        Each reaction gets a single bounds update (one solver call for both
+        columns limits) instead of separate lower/upper assignments. With the
+        model's compiled GPRs, knockouts are resolved in one pass over all
+        rules and only the reactions that actually lose activity are closed,
+        rather than re-evaluating every affected rule per knocked-out gene.
+        """
         if constraints:
+            reactions = model.reactions
             for rxn_id, bounds in constraints.items():
-                if rxn_id in model.reactions:
-                    rxn = model.reactions.get_by_id(rxn_id)
-                    if "lb" in bounds:
-                        rxn.lower_bound = bounds["lb"]
-                    if "ub" in bounds:
-                        rxn.upper_bound = bounds["ub"]
+                if rxn_id in reactions:
+                    rxn = reactions.get_by_id(rxn_id)
+                    rxn.bounds = (
+                        bounds.get("lb", rxn.lower_bound),
+                        bounds.get("ub", rxn.upper_bound),
+                    )
 
         if knockouts:
-            for gene_id in knockouts:
-                if gene_id in model.genes:
-                    gene = model.genes.get_by_id(gene_id)
-                    gene.knock_out()
+            genes = model.genes
+            if gprs is None:
+                for gene_id in knockouts:
+                    if gene_id in genes:
+                        genes.get_by_id(gene_id).knock_out()
+            else:
+                knocked = {gene_id: 0.0 for gene_id in knockouts if gene_id in genes}
+                if knocked:
+                    for gene_id in knocked:
+                        genes.get_by_id(gene_id).functional = False
+                    levels = gprs.evaluate(knocked)
+                    reactions = model.reactions
+                    for rxn_id, level in levels.items():
+                        if level == 0.0:
+                            reactions.get_by_id(rxn_id).bounds = (0.0, 0.0)
 
         return model
 
+    def moma_reference(
+        entry: CachedModel,
+        constraints: Dict,
+        reference_fluxes: Optional[Dict[str, float]],
+    ):
+        """
+        Reference solution for MOMA
+
+        Supplied reference fluxes are used as-is (reactions they omit fall
+        back to the wild type). Otherwise the wild type is solved under the
+        request's constraints but without its knockouts; the unconstrained
+        wild type is computed once per model and kept on the cache entry.
+        """
+
+        reactions = [rxn.id for rxn in entry.model.reactions]
+        if reference_fluxes and all(rxn_id in reference_fluxes for rxn_id in reactions):
+            fluxes = pd.Series(reference_fluxes).reindex(reactions)
+            return cobra.Solution(objective_value=float("nan"), status="optimal", fluxes=fluxes)
+
+        if not constraints and entry.wild_type_fluxes is not None:
+            fluxes = entry.wild_type_fluxes
+        else:
+            with solver_sessions.session(entry.token, entry.model) as model:
+                apply_constraints(model, constraints, [])
+                solution = model.optimize()
+            if solution.status != "optimal":
+                raise ValueError(f"Wild-type reference solve is {solution.status}")
+            fluxes = solution.fluxes
+            if not constraints:
+                entry.wild_type_fluxes = fluxes
+
+        if reference_fluxes:
+            fluxes = fluxes.copy()
+            fluxes.update(pd.Series(reference_fluxes))
+        return cobra.Solution(objective_value=float("nan"), status="optimal", fluxes=fluxes)
+
+    def fva_processes(num_reactions: int, requested: Optional[int] = None) -> int:
+        """Number of worker processes for an FVA over num_reactions reactions"""
+        max_processes = os.cpu_count() or 1
+        env_value = os.environ.get("METABOLICSUITE_FVA_PROCESSES")
+        if env_value:
+            try:
+                max_processes = max(1, int(env_value))
+            except ValueError:
+                logger.warning(f"Ignoring invalid METABOLICSUITE_FVA_PROCESSES={env_value!r}")
+
+        if requested is not None:
+            return max(1, min(requested, max_processes))
+
+        return max(1, min(max_processes, num_reactions // FVA_MIN_REACTIONS_PER_PROCESS))
+
     # ========================================================================
     # Health Check
     # ========================================================================
@@ -199,35 +644,29 @@ def create_app():
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
-        import cobra
         return {
             "status": "healthy",
             "cobra_version": cobra.__version__,
-            "solver": str(cobra.Configuration().solver),
+            "solver": interface_to_str(cobra.Configuration().solver),
         }
 
     # ========================================================================
     # Model Information
     # ========================================================================
 
+    @app.post("/model/register", response_model=ModelToken)
+    async def register_model(request: ModelData):
+        """
+        Upload a model once and get a token for subsequent solve requests.
+
+        Pass {"model_token": ...} as the request model to skip re-uploading.
+        """
+        return ModelToken(model_token=cached_model(request).token)
+
     @app.post("/model/info", response_model=ModelInfoResponse)
-    async def get_model_info(request: ModelData):
+    async def get_model_info(request: Union[ModelData, ModelToken]):
         """Get model statistics and information"""
-        model = model_from_dict(request)
-
-        compartments = list(set(m.compartment for m in model.metabolites))
-        subsystems = list(set(r.subsystem for r in model.reactions if r.subsystem))
-
-        return ModelInfoResponse(
-            id=model.id,
-            name=model.name,
-            num_reactions=len(model.reactions),
-            num_metabolites=len(model.metabolites),
-            num_genes=len(model.genes),
-            objective=str(model.objective.expression) if model.objective else None,
-            compartments=compartments,
-            subsystems=subsystems,
-        )
+        return cached_model(request).model_info()
 
     # ========================================================================
     # FBA Endpoint
@@ -241,33 +680,27 @@ def create_app():
         Standard FBA maximizing objective (typically biomass).
         Uses native solvers for performance.
         """
-        import time
-        import cobra
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
-            model = apply_constraints(model, request.constraints or {}, request.knockouts or [])
+            entry = cached_model(request.model)
+            with request_model(entry, request.warm_start, request.solver) as model:
+                model = apply_constraints(
+                    model, request.constraints or {}, request.knockouts or [], entry.compiled_gprs()
+                )
 
-            if request.objective and request.objective in model.reactions:
-                model.objective = request.objective
+                if request.objective and request.objective in model.reactions:
+                    model.objective = request.objective
 
-            solution = model.optimize()
+                solution = model.optimize()
 
-            solve_time = time.time() - start_time
+                solve_time = time.time() - start_time
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                shadow_prices={met.id: solution.shadow_prices.get(met.id, 0) for met in model.metabolites},
-                reduced_costs={rxn.id: solution.reduced_costs.get(rxn.id, 0) for rxn in model.reactions},
-                method="fba",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                return response_class(content=fba_payload(model, solution, "fba", solve_time))
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"FBA solve error: {e}")
             return SolverResponse(
@@ -276,6 +709,60 @@ def create_app():
                 method="fba",
             )
 
+    @app.post("/solve/fba_sweep", response_model=FBASweepResponse)
+    async def solve_fba_sweep(request: FBASweepRequest):
+        """
+        FBA over a sequence of scenarios
+
+        All scenarios are solved on the model's persistent solver session.
+        Only the bounds and objective named in each scenario are changed (and
+        reverted afterwards), so the LP warm-starts from the previous basis.
+        """
+
+        start_time = time.time()
+
+        try:
+            entry = cached_model(request.model)
+            results = []
+
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
+                for scenario in request.scenarios:
+                    scenario_start = time.time()
+                    try:
+                        with model:
+                            apply_constraints(
+                                model,
+                                scenario.constraints or {},
+                                scenario.knockouts or [],
+                                entry.compiled_gprs(),
+                            )
+                            if scenario.objective and scenario.objective in model.reactions:
+                                model.objective = scenario.objective
+
+                            solution = model.optimize()
+                            results.append(
+                                fba_payload(model, solution, "fba", time.time() - scenario_start)
+                            )
+                    except Exception as e:
+                        logger.error(f"FBA sweep scenario error: {e}")
+                        results.append(solver_payload(status="error", error=str(e), method="fba"))
+
+            return response_class(content={
+                "status": "completed",
+                "results": results,
+                "solve_time": time.time() - start_time,
+                "error": None,
+            })
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"FBA sweep error: {e}")
+            return FBASweepResponse(
+                status="error",
+                error=str(e),
+            )
+
     # ========================================================================
     # pFBA Endpoint
     # ========================================================================
@@ -288,32 +775,27 @@ def create_app():
         Minimizes total flux while maintaining optimal objective.
         Reference: Lewis et al. (2010) Mol Syst Biol
         """
-        import time
-        import cobra
-        from cobra.flux_analysis import pfba
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
-            model = apply_constraints(model, request.constraints or {}, request.knockouts or [])
+            entry = cached_model(request.model)
+            with request_model(entry, request.warm_start, request.solver) as model:
+                model = apply_constraints(
+                    model, request.constraints or {}, request.knockouts or [], entry.compiled_gprs()
+                )
 
-            if request.objective and request.objective in model.reactions:
-                model.objective = request.objective
+                if request.objective and request.objective in model.reactions:
+                    model.objective = request.objective
 
-            solution = pfba(model)
+                solution = pfba(model)
 
-            solve_time = time.time() - start_time
+                solve_time = time.time() - start_time
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                method="pfba",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                return solver_result(model, "pfba", solution, solve_time)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"pFBA solve error: {e}")
             return SolverResponse(
@@ -334,25 +816,41 @@ def create_app():
         Determines min/max flux ranges for reactions.
         Reference: Mahadevan & Schilling (2003) Metab Eng
         """
-        import time
-        import cobra
-        from cobra.flux_analysis import flux_variability_analysis
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
-            model = apply_constraints(model, request.constraints or {}, request.knockouts or [])
+            entry = cached_model(request.model)
+            model = apply_constraints(
+                use_solver(entry.model.copy(), request.solver),
+                request.constraints or {},
+                request.knockouts or [],
+                entry.compiled_gprs(),
+            )
 
             # Determine which reactions to analyze
             reaction_list = None
             if request.reactions:
-                reaction_list = [model.reactions.get_by_id(r) for r in request.reactions if r in model.reactions]
+                # cobra solves every minimum and then every maximum, recycling the
+                # basis within each direction. Deduplicate and sweep in model order
+                # so consecutive LPs differ by a single objective column.
+                requested = set(request.reactions)
+                reaction_list = [rxn for rxn in model.reactions if rxn.id in requested]
+
+            num_reactions = len(model.reactions if reaction_list is None else reaction_list)
+
+            # Solve the objective once up front: it is the value we report, it
+            # fails fast on an infeasible model, and cobra's own optimum solve
+            # inside FVA then restarts from this basis
+            objective_value = model.slim_optimize(error_value=None)
 
+            # FVA is 2 independent LPs per reaction; cobra shards the reaction
+            # list across a process pool and each worker keeps its own basis
             fva_result = flux_variability_analysis(
                 model,
                 reaction_list=reaction_list,
                 fraction_of_optimum=request.fraction_of_optimum,
+                processes=fva_processes(num_reactions, request.processes),
             )
 
             # Convert to response format
@@ -365,16 +863,16 @@ def create_app():
 
             solve_time = time.time() - start_time
 
-            # Get objective value
-            solution = model.optimize()
-
-            return FVAResponse(
-                status="optimal",
-                objective_value=solution.objective_value,
-                ranges=ranges,
-                solve_time=solve_time,
-            )
+            return response_class(content={
+                "status": "optimal",
+                "objective_value": objective_value,
+                "ranges": ranges,
+                "solve_time": solve_time,
+                "error": None,
+            })
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"FVA solve error: {e}")
             return FVAResponse(
@@ -394,38 +892,30 @@ def create_app():
         Finds flux distribution closest to wild-type reference.
         Reference: Segre et al. (2002) PNAS
         """
-        import time
-        import cobra
-        from cobra.flux_analysis import moma
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
+            entry = cached_model(request.model)
+            constraints = request.constraints or {}
 
-            # Get wild-type solution if no reference provided
-            if request.reference_fluxes:
-                reference = request.reference_fluxes
-            else:
-                wt_solution = model.optimize()
-                reference = {rxn.id: wt_solution.fluxes[rxn.id] for rxn in model.reactions}
+            # Wild-type reference: no LP at all when the caller supplies one
+            reference = moma_reference(entry, constraints, request.reference_fluxes)
 
-            # Apply knockouts
-            model = apply_constraints(model, request.constraints or {}, request.knockouts or [])
+            # Apply knockouts on the session model; reverted when the block exits
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
+                apply_constraints(
+                    model, constraints, request.knockouts or [], entry.compiled_gprs()
+                )
 
-            solution = moma(model, solution=reference, linear=False)
+                solution = moma(model, solution=reference, linear=False)
 
-            solve_time = time.time() - start_time
+                solve_time = time.time() - start_time
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                method="moma",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                return solver_result(model, "moma", solution, solve_time)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"MOMA solve error: {e}")
             return SolverResponse(
@@ -446,66 +936,51 @@ def create_app():
         Minimizes use of low-expression reactions while maintaining objective.
         Reference: Becker & Palsson (2008) PLoS Comput Biol
         """
-        import time
-        import cobra
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
+            entry = cached_model(request.model)
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
 
-            # Map gene expression to reactions using GPR
-            reaction_expression = {}
-            for rxn in model.reactions:
-                if rxn.gene_reaction_rule:
-                    expr = evaluate_gpr_expression(rxn.gene_reaction_rule, request.expression)
-                    reaction_expression[rxn.id] = expr
-                else:
-                    reaction_expression[rxn.id] = 1.0  # Constitutive
-
-            # GIMME objective: min sum(|v_i| * (threshold - expr_i)) for low-expression
-            # Subject to: v_biomass >= fraction * v_biomass_max
+                # Map gene expression to reactions using GPR (reactions without a
+                # rule are constitutive and default to 1.0 below)
+                reaction_expression = entry.compiled_gprs().evaluate(request.expression)
 
-            # First, get optimal objective value
-            solution = model.optimize()
-            if solution.status != "optimal":
-                raise ValueError(f"Model infeasible: {solution.status}")
+                # GIMME objective: min sum(|v_i| * (threshold - expr_i)) for low-expression
+                # Subject to: v_biomass >= fraction * v_biomass_max
 
-            required_obj = request.required_fraction * solution.objective_value
+                # First, get optimal objective value
+                solution = model.optimize()
+                if solution.status != "optimal":
+                    raise ValueError(f"Model infeasible: {solution.status}")
 
-            # Add objective constraint
-            obj_rxn = list(model.objective.variables.keys())[0]
-            obj_rxn.lower_bound = required_obj
+                required_obj = request.required_fraction * solution.objective_value
 
-            # Build GIMME objective
-            from cobra import Reaction
-            import optlang
+                # Keep the original objective at or above the required fraction
+                fix_objective_as_constraint(model, bound=required_obj)
 
-            # Create auxiliary variables and constraints for GIMME
-            gimme_objective = 0
-            for rxn in model.reactions:
-                expr_val = reaction_expression.get(rxn.id, 1.0)
-                if expr_val < request.threshold:
-                    # Penalize flux through low-expression reactions
-                    penalty = request.threshold - expr_val
-                    gimme_objective += penalty * (rxn.flux_expression.forward_variable + rxn.flux_expression.reverse_variable)
+                # Penalize flux through low-expression reactions. Coefficients go
+                # straight to the solver instead of growing a symbolic sum per term.
+                coefficients = {}
+                for rxn in model.reactions:
+                    expr_val = reaction_expression.get(rxn.id, 1.0)
+                    if expr_val < request.threshold:
+                        penalty = request.threshold - expr_val
+                        coefficients[rxn.forward_variable] = penalty
+                        coefficients[rxn.reverse_variable] = penalty
 
-            model.objective = gimme_objective
-            model.objective_direction = "min"
+                model.objective = model.problem.Objective(Zero, direction="min", sloppy=True)
+                model.objective.set_linear_coefficients(coefficients)
 
-            solution = model.optimize()
+                solution = model.optimize()
 
-            solve_time = time.time() - start_time
+                solve_time = time.time() - start_time
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                method="gimme",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                return solver_result(model, "gimme", solution, solve_time)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"GIMME solve error: {e}")
             return SolverResponse(
@@ -528,89 +1003,78 @@ def create_app():
 
         Reference: Shlomi et al. (2008) Nat Biotechnol
         """
-        import time
-        import cobra
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
+            entry = cached_model(request.model)
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
 
-            # Map gene expression to reactions
-            high_expr_rxns = []
-            low_expr_rxns = []
+                # Map gene expression to reactions
+                high_expr_rxns = []
+                low_expr_rxns = []
 
-            for rxn in model.reactions:
-                if rxn.gene_reaction_rule:
-                    expr = evaluate_gpr_expression(rxn.gene_reaction_rule, request.expression)
+                for rxn_id, expr in entry.compiled_gprs().evaluate(request.expression).items():
                     if expr >= request.high_threshold:
-                        high_expr_rxns.append(rxn.id)
+                        high_expr_rxns.append(rxn_id)
                     elif expr <= request.low_threshold:
-                        low_expr_rxns.append(rxn.id)
-
-            # iMAT MILP formulation:
-            # Binary variables y_h, y_l for high/low expression reactions
-            # Maximize: sum(y_h) + sum(y_l)
-            # Subject to:
-            #   v_i >= epsilon * y_h_i (high expression -> active)
-            #   v_i <= M * (1 - y_l_i) (low expression -> inactive)
-
-            epsilon = 1e-3
-            M = 1000
-
-            # Add binary variables
-            for rxn_id in high_expr_rxns:
-                rxn = model.reactions.get_by_id(rxn_id)
-                var_name = f"y_h_{rxn_id}"
-                y_h = model.problem.Variable(var_name, type="binary")
-                model.solver.add(y_h)
-
-                # v >= epsilon * y_h
-                constraint = model.problem.Constraint(
-                    rxn.forward_variable + rxn.reverse_variable - epsilon * y_h,
-                    lb=0,
-                    name=f"imat_high_{rxn_id}"
-                )
-                model.solver.add(constraint)
-
-            for rxn_id in low_expr_rxns:
-                rxn = model.reactions.get_by_id(rxn_id)
-                var_name = f"y_l_{rxn_id}"
-                y_l = model.problem.Variable(var_name, type="binary")
-                model.solver.add(y_l)
-
-                # v <= M * (1 - y_l) => v + M*y_l <= M
-                constraint = model.problem.Constraint(
-                    rxn.forward_variable + rxn.reverse_variable + M * y_l,
-                    ub=M,
-                    name=f"imat_low_{rxn_id}"
-                )
-                model.solver.add(constraint)
+                        low_expr_rxns.append(rxn_id)
 
-            # Set objective to maximize binary variables
-            obj_terms = []
-            for rxn_id in high_expr_rxns:
-                obj_terms.append(model.solver.variables[f"y_h_{rxn_id}"])
-            for rxn_id in low_expr_rxns:
-                obj_terms.append(model.solver.variables[f"y_l_{rxn_id}"])
+                # iMAT MILP formulation:
+                # Binary variables y_h, y_l for high/low expression reactions
+                # Maximize: sum(y_h) + sum(y_l)
+                # Subject to:
+                #   v_i >= epsilon * y_h_i (high expression -> active)
+                #   v_i <= M * (1 - y_l_i) (low expression -> inactive)
 
-            if obj_terms:
-                model.objective = sum(obj_terms)
-                model.objective_direction = "max"
+                epsilon = 1e-3
+                M = 1000
 
-            solution = model.optimize()
+                # Build all binary variables and constraints first and hand them
+                # to the solver in one call (one interface update, not 2k)
+                indicators = []
+                constraints = []
 
-            solve_time = time.time() - start_time
+                for rxn_id in high_expr_rxns:
+                    rxn = model.reactions.get_by_id(rxn_id)
+                    y_h = model.problem.Variable(f"y_h_{rxn_id}", type="binary")
+                    indicators.append(y_h)
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes.get(rxn.id, 0) for rxn in model.reactions},
-                method="imat",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                    # v >= epsilon * y_h
+                    constraints.append(model.problem.Constraint(
+                        rxn.forward_variable + rxn.reverse_variable - epsilon * y_h,
+                        lb=0,
+                        name=f"imat_high_{rxn_id}"
+                    ))
+
+                for rxn_id in low_expr_rxns:
+                    rxn = model.reactions.get_by_id(rxn_id)
+                    y_l = model.problem.Variable(f"y_l_{rxn_id}", type="binary")
+                    indicators.append(y_l)
+
+                    # v <= M * (1 - y_l) => v + M*y_l <= M
+                    constraints.append(model.problem.Constraint(
+                        rxn.forward_variable + rxn.reverse_variable + M * y_l,
+                        ub=M,
+                        name=f"imat_low_{rxn_id}"
+                    ))
+
+                # add_cons_vars registers the removal with the model context
+                model.add_cons_vars(indicators + constraints)
+
+                # Set objective to maximize binary variables. add() builds one
+                # flat sum; Python's sum() re-copies the expression per term.
+                if indicators:
+                    model.objective = model.problem.Objective(add(indicators), direction="max")
 
+                solution = model.optimize()
+
+                solve_time = time.time() - start_time
+
+                return solver_result(model, "imat", solution, solve_time)
+
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"iMAT solve error: {e}")
             return SolverResponse(
@@ -631,38 +1095,31 @@ def create_app():
         Scales reaction bounds proportionally to expression.
         Reference: Colijn et al. (2009) Mol Syst Biol
         """
-        import time
-        import cobra
 
         start_time = time.time()
 
         try:
-            model = model_from_dict(request.model)
+            entry = cached_model(request.model)
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
 
-            # Map expression to reactions and scale bounds
-            for rxn in model.reactions:
-                if rxn.gene_reaction_rule:
-                    expr = evaluate_gpr_expression(rxn.gene_reaction_rule, request.expression)
+                # Map expression to reactions and scale bounds
+                for rxn_id, expr in entry.compiled_gprs().evaluate(request.expression).items():
                     # Scale bounds proportionally (0-1 normalized expression)
                     if expr < 1.0:
+                        rxn = model.reactions.get_by_id(rxn_id)
                         if rxn.upper_bound > 0:
                             rxn.upper_bound *= expr
                         if rxn.lower_bound < 0:
                             rxn.lower_bound *= expr
 
-            solution = model.optimize()
+                solution = model.optimize()
 
-            solve_time = time.time() - start_time
+                solve_time = time.time() - start_time
 
-            return SolverResponse(
-                status=solution.status,
-                objective_value=solution.objective_value,
-                fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                method="eflux",
-                solver=str(cobra.Configuration().solver),
-                solve_time=solve_time,
-            )
+                return solver_result(model, "eflux", solution, solve_time)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"E-Flux solve error: {e}")
             return SolverResponse(
@@ -679,7 +1136,7 @@ def create_app():
         """Request for benchmark comparison"""
         model: ModelData
         method: str = Field(default="fba", pattern="^(fba|pfba)$")
-        solver: str = Field(default="glpk", pattern="^(glpk|cplex|gurobi)$")
+        solver: str = Field(default="glpk", pattern=SOLVER_PATTERN)
 
     class BenchmarkResponse(BaseModel):
         """Benchmark result for comparison with HiGHS"""
@@ -697,38 +1154,39 @@ def create_app():
 
         Used by the frontend BenchmarkRunner to validate numerical accuracy.
         """
-        import time
-        import cobra
 
         start_time = time.perf_counter()
 
         try:
-            model = model_from_dict(request.model)
-            model.solver = request.solver
-
-            if request.method == "fba":
-                solution = model.optimize()
-            elif request.method == "pfba":
-                solution = cobra.flux_analysis.pfba(model)
-            else:
-                raise ValueError(f"Unknown method: {request.method}")
-
-            solve_time_ms = (time.perf_counter() - start_time) * 1000
-
-            if solution.status == "optimal":
-                return BenchmarkResponse(
-                    status="optimal",
-                    objective_value=solution.objective_value,
-                    fluxes={rxn.id: solution.fluxes[rxn.id] for rxn in model.reactions},
-                    solve_time_ms=solve_time_ms,
-                    solver=f"cobrapy-{request.solver}",
-                )
-            else:
-                return BenchmarkResponse(
-                    status=solution.status,
-                    solve_time_ms=solve_time_ms,
-                    solver=f"cobrapy-{request.solver}",
-                )
+            # Benchmarks repeat the same model: reuse its (token, solver) session
+            # so the LP is built once and later solves start from its basis
+            entry = cached_model(request.model)
+            with solver_sessions.session(entry.token, entry.model, request.solver) as model:
+                if request.method == "fba":
+                    solution = model.optimize()
+                elif request.method == "pfba":
+                    solution = pfba(model)
+                else:
+                    raise ValueError(f"Unknown method: {request.method}")
+
+                solve_time_ms = (time.perf_counter() - start_time) * 1000
+
+                if solution.status == "optimal":
+                    # Plain payload: skips pydantic validating every flux value
+                    return response_class(content={
+                        "status": "optimal",
+                        "objective_value": solution.objective_value,
+                        "fluxes": series_to_dict(solution.fluxes),
+                        "solve_time_ms": solve_time_ms,
+                        "solver": f"cobrapy-{request.solver}",
+                        "error": None,
+                    })
+                else:
+                    return BenchmarkResponse(
+                        status=solution.status,
+                        solve_time_ms=solve_time_ms,
+                        solver=f"cobrapy-{request.solver}",
+                    )
 
         except Exception as e:
             solve_time_ms = (time.perf_counter() - start_time) * 1000
@@ -746,7 +1204,7 @@ def create_app():
         from .benchmark import BiGGModelCatalog
         try:
             catalog = BiGGModelCatalog()
-            models = catalog.fetch_catalog()
+            models = await catalog.fetch_catalog_async()
             return {"models": [
                 {
                     "bigg_id": m.bigg_id,
@@ -770,7 +1228,11 @@ def create_app():
         """
         from .benchmark import run_full_benchmark
         try:
-            result = run_full_benchmark(num_models=num_models, methods=methods)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                benchmark_executor,
+                partial(run_full_benchmark, num_models=num_models, methods=methods),
+            )
             return result
         except Exception as e:
             logger.error(f"Benchmark failed: {e}")
@@ -783,6 +1245,126 @@ def create_app():
 # GPR Expression Evaluation
 # ============================================================================
 
+class GPRParseError(ValueError):
+    """Raised when a GPR rule is not a valid AND/OR expression of gene ids"""
+
+
+# Token kinds, numbered after the capture groups of _GPR_TOKEN_RE
+_TOK_LPAREN, _TOK_RPAREN, _TOK_AND, _TOK_OR, _TOK_GENE = range(1, 6)
+
+# One alternation per token kind. Keywords match case-insensitively and only
+# as whole tokens ("android" is a gene); whitespace is skipped by finditer.
+_GPR_TOKEN_RE = re.compile(
+    r"(\()|(\))|(and)(?=[\s()]|$)|(or)(?=[\s()]|$)|([^\s()]+)", re.IGNORECASE
+)
+
+
+# Deletes every character a GPR rule may contain: anything left over after
+# rule.translate() means the rule is not a plain AND/OR of gene ids
+_GPR_ALLOWED = string.ascii_letters + string.digits + string.whitespace + "()_.:-"
+_GPR_LEGAL_CHARS = str.maketrans("", "", _GPR_ALLOWED)
+
+
+def _tokenize(rule: str) -> List[tuple]:
+    """Split a GPR rule into (kind, text) tokens in a single regex pass"""
+    return [(m.lastindex, m.group()) for m in _GPR_TOKEN_RE.finditer(rule)]
+
+
+# Flat n-ary programs in postorder: (_LOAD, i) pushes gene i (a negative i
+# pushes 1.0), (_MIN, n) / (_MAX, n) replace the top n values by their min/max
+_LOAD, _MIN, _MAX = 0, 1, 2
+
+# Rules nested deeper than this run on the stack machine; rendered min()/max()
+# source would run into recursion and parser nesting limits
+_GPR_MAX_NESTING = 100
+
+
+def _postfix_to_program(postfix: List[int]):
+    """
+    Turn binary postfix opcodes into a flat n-ary program and its depth.
+
+    Runs of the same operator are merged into one node, so "a or b or c"
+    becomes a single (_MAX, 3) rather than two nested binary nodes.
+    """
+    stack: List[tuple] = []  # (program, root op, root arity, depth)
+    for code in postfix:
+        if code >= 0:
+            stack.append(([(_LOAD, code)], _LOAD, 1, 0))
+            continue
+        op = _MIN if code == GPR_AND else _MAX
+        right = stack.pop()
+        program, left_op, left_arity, left_depth = stack.pop()
+        if left_op == op:
+            program.pop()
+            arity, depth = left_arity, left_depth
+        else:
+            arity, depth = 1, left_depth + 1
+        if right[1] == op:
+            program.extend(right[0][:-1])
+            arity, depth = arity + right[2], max(depth, right[3])
+        else:
+            program.extend(right[0])
+            arity, depth = arity + 1, max(depth, right[3] + 1)
+        program.append((op, arity))
+        stack.append((program, op, arity, depth))
+    if not stack:
+        return [], 0
+    return stack[0][0], stack[0][3]
+
+
+def _run_gpr_program(program, values, lowest=min, highest=max, one=1.0):
+    """Evaluate a flat program with an explicit value stack (no recursion)"""
+    stack: List[Any] = []
+    push = stack.append
+    for op, arg in program:
+        if op == _LOAD:
+            push(values[arg] if arg >= 0 else one)
+        else:
+            args = stack[-arg:]
+            del stack[-arg:]
+            push(lowest(args) if op == _MIN else highest(args))
+    return stack[0]
+
+
+def _render_program(
+    program, leaf: Callable[[int], str], call: Callable[[int, List[str]], str]
+) -> str:
+    """Render a flat program as source: leaf(i) for genes, call(op, args) for nodes"""
+    stack: List[str] = []
+    for op, arg in program:
+        if op == _LOAD:
+            stack.append(leaf(arg))
+        else:
+            args = stack[-arg:]
+            del stack[-arg:]
+            stack.append(call(op, args))
+    return stack[0]
+
+
+def _python_call(op: int, args: List[str]) -> str:
+    return f"{'min' if op == _MIN else 'max'}({', '.join(args)})"
+
+
+@lru_cache(maxsize=4096)
+def _parse_gpr(gpr_rule: str):
+    """
+    (gene ids, flat program) for a GPR rule, or None if it is blank or
+    unparseable. Program leaves index the returned gene ids.
+    """
+    if not gpr_rule or gpr_rule.isspace():
+        return None
+    genes: Dict[str, int] = {}
+    try:
+        postfix = _gpr_to_postfix(gpr_rule, genes)
+    except GPRParseError as e:
+        logger.warning(f"Treating GPR as constitutive: {e}")
+        return None
+    program, _ = _postfix_to_program(postfix)
+    if not program:
+        return None
+    return tuple(genes), tuple(program)
+
+
 def evaluate_gpr_expression(gpr_rule: str, expression: Dict[str, float]) -> float:
     """
     Evaluate GPR rule to get reaction expression level.
@@ -790,6 +1372,13 @@ def evaluate_gpr_expression(gpr_rule: str, expression: Dict[str, float]) -> floa
     AND -> MIN (enzyme complex limited by lowest subunit)
     OR -> MAX (isozymes, highest expression dominates)
 
+    Each distinct rule is parsed once and cached as a flat program; repeated
+    calls only run it through _run_gpr_program, the stack machine
+    CompiledGPRs also uses for deeply nested rules.
+    A malformed rule raises GPRParseError at that parse, is logged once, and
+    evaluates as constitutive (1.0) from then on. Parsing and evaluation are
+    iterative, so nesting depth is not bounded by the recursion limit.
+
     Args:
         gpr_rule: Boolean expression (e.g., "(geneA and geneB) or geneC")
         expression: Dictionary of gene_id -> expression value (0-1 normalized)
@@ -797,64 +1386,263 @@ def evaluate_gpr_expression(gpr_rule: str, expression: Dict[str, float]) -> floa
     Returns:
         Reaction expression level (0-1)
     """
-    if not gpr_rule or not gpr_rule.strip():
-        return 1.0  # Constitutive
-
-    def get_gene_expr(gene_id: str) -> float:
-        return expression.get(gene_id.strip(), 1.0)
-
-    def evaluate(expr: str) -> float:
-        expr = expr.strip()
-
-        # Handle parentheses
-        while "(" in expr:
-            # Find innermost parentheses
-            start = expr.rfind("(")
-            end = expr.find(")", start)
-            inner = expr[start + 1:end]
-            result = evaluate(inner)
-            expr = expr[:start] + str(result) + expr[end + 1:]
-
-        # Handle OR (max)
-        if " or " in expr.lower():
-            parts = expr.lower().split(" or ")
-            values = [evaluate(p) for p in parts]
-            return max(values)
-
-        # Handle AND (min)
-        if " and " in expr.lower():
-            parts = expr.lower().split(" and ")
-            values = [evaluate(p) for p in parts]
-            return min(values)
-
-        # Single gene or numeric value
+    parsed = _parse_gpr(gpr_rule)
+    if parsed is None:
+        return 1.0
+    genes, program = parsed
+    return _run_gpr_program(program, [expression.get(g, 1.0) for g in genes])
+
+
+# ============================================================================
+# Compiled GPR Programs
+# ============================================================================
+
+# Postfix opcodes; non-negative codes push the expression of that gene index
+GPR_AND = -1
+GPR_OR = -2
+
+_gpr_kernel = None
+
+
+def _gpr_to_postfix(gpr_rule: str, gene_index: Dict[str, int]) -> List[int]:
+    """
+    Translate a GPR rule to postfix opcodes (shunting-yard, AND binds tighter).
+
+    Raises GPRParseError on characters that cannot occur in a gene id or
+    operator, unbalanced parentheses, or dangling operators. Every GPR
+    evaluator parses through here, so they all reject the same rules.
+    """
+    if gpr_rule.translate(_GPR_LEGAL_CHARS):
+        raise GPRParseError(f"Unexpected characters in GPR: {gpr_rule!r}")
+
+    precedence = {GPR_AND: 2, GPR_OR: 1}
+    output: List[int] = []
+    operators: List[Any] = []
+    expect_operand = True
+
+    for kind, token in _tokenize(gpr_rule):
+        if kind == _TOK_LPAREN:
+            if not expect_operand:
+                raise GPRParseError(f"Unexpected '(' in GPR: {gpr_rule}")
+            operators.append(token)
+        elif kind == _TOK_RPAREN:
+            if expect_operand:
+                raise GPRParseError(f"Unexpected ')' in GPR: {gpr_rule}")
+            while operators and operators[-1] != "(":
+                output.append(operators.pop())
+            if not operators:
+                raise GPRParseError(f"Unbalanced ')' in GPR: {gpr_rule}")
+            operators.pop()
+        elif kind != _TOK_GENE:
+            if expect_operand:
+                raise GPRParseError(f"Dangling '{token}' in GPR: {gpr_rule}")
+            op = GPR_AND if kind == _TOK_AND else GPR_OR
+            while (
+                operators
+                and operators[-1] != "("
+                and precedence[operators[-1]] >= precedence[op]
+            ):
+                output.append(operators.pop())
+            operators.append(op)
+            expect_operand = True
+        else:
+            if not expect_operand:
+                raise GPRParseError(f"Missing operator before '{token}' in GPR: {gpr_rule}")
+            output.append(gene_index.setdefault(token, len(gene_index)))
+            expect_operand = False
+
+    if expect_operand and output:
+        raise GPRParseError(f"GPR ends with an operator: {gpr_rule}")
+    while operators:
+        op = operators.pop()
+        if op == "(":
+            raise GPRParseError(f"Unbalanced '(' in GPR: {gpr_rule}")
+        output.append(op)
+
+    return output
+
+
+def _eval_postfix(code, offsets, values, stack, out):
+    """
+    Stack machine over all reaction programs: AND -> min, OR -> max.
+
+    Written in the numba-compatible subset so the same function runs either
+    jitted on arrays or interpreted on lists. Empty programs evaluate to 1.0.
+    """
+    for r in range(len(offsets) - 1):
+        sp = 0
+        for k in range(offsets[r], offsets[r + 1]):
+            op = code[k]
+            if op >= 0:
+                stack[sp] = values[op]
+                sp += 1
+            else:
+                sp -= 1
+                a = stack[sp]
+                b = stack[sp - 1]
+                if op == -1:
+                    stack[sp - 1] = a if a < b else b
+                else:
+                    stack[sp - 1] = a if a > b else b
+        out[r] = stack[0] if sp > 0 else 1.0
+
+
+def _get_gpr_kernel():
+    """Return the numba-jitted postfix evaluator, or None without numba"""
+    global _gpr_kernel
+    if _gpr_kernel is None:
         try:
-            return float(expr)
-        except ValueError:
-            return get_gene_expr(expr)
+            import numba
+            _gpr_kernel = numba.njit(cache=True, nogil=True)(_eval_postfix)
+        except ImportError:
+            _gpr_kernel = False
+    return _gpr_kernel or None
 
-    try:
-        return evaluate(gpr_rule)
-    except Exception:
-        return 1.0  # Default to constitutive on parse error
+
+class CompiledGPRs:
+    """
+    Postfix programs for every GPR rule in a model.
+
+    Rules are parsed once per model; evaluating a new expression profile is a
+    single pass of the stack machine over a dense gene vector (or, without
+    numba, one eval of the rules compiled to Python bytecode). Genes missing
+    from the profile default to 1.0, unparseable rules evaluate to 1.0
+    (constitutive), matching evaluate_gpr_expression. For many profiles,
+    compile once and call evaluate per profile.
+    """
+
+    def __init__(self, rxn_ids: List[str], programs: List[List[int]], gene_index: Dict[str, int]):
+        self.rxn_ids = rxn_ids
+        self.gene_index = gene_index
+        self.genes = list(gene_index)
+        self.offsets = np.zeros(len(programs) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum([len(p) for p in programs])
+        self.code = np.fromiter(
+            (op for program in programs for op in program),
+            dtype=np.int64,
+            count=int(self.offsets[-1]),
+        )
+        self.max_depth = max((len(p) for p in programs), default=0) + 1
+        self._programs = programs
+        self._bytecode = None
+        self._deep: List[tuple] = []
+
+    def evaluate(self, expression: Dict[str, float]) -> Dict[str, float]:
+        """Reaction id -> expression level for every reaction with a GPR"""
+        values = np.fromiter(
+            (expression.get(g, 1.0) for g in self.genes),
+            dtype=np.float64,
+            count=len(self.genes),
+        )
+        out = np.empty(len(self.rxn_ids), dtype=np.float64)
+        kernel = _get_gpr_kernel()
+        if kernel is not None:
+            kernel(self.code, self.offsets, values, np.empty(self.max_depth), out)
+            return dict(zip(self.rxn_ids, out.tolist()))
+
+        # Without numba: every rule rendered as min()/max() calls in one tuple
+        # expression, compiled once, so each request is a single eval
+        if self._bytecode is None:
+            self._compile_bytecode()
+        values = values.tolist()
+        result = eval(self._bytecode, {"__builtins__": {}, "min": min, "max": max}, {"v": values})
+        if self._deep:
+            result = list(result)
+            for r, program in self._deep:
+                result[r] = _run_gpr_program(program, values)
+        return dict(zip(self.rxn_ids, result))
+
+    def _compile_bytecode(self):
+        """One tuple expression for all rules; too-deep rules stay stack programs"""
+        parts = []
+        self._deep = []
+        for r, postfix in enumerate(self._programs):
+            program, depth = _postfix_to_program(postfix)
+            if not program:
+                parts.append("1.0")
+            elif depth > _GPR_MAX_NESTING:
+                parts.append("None")
+                self._deep.append((r, program))
+            else:
+                parts.append(_render_program(program, lambda i: f"v[{i}]", _python_call))
+        source = "".join(f"{part},\n" for part in parts)
+        self._bytecode = compile(f"({source})", "<gpr>", "eval")
+
+
+def compile_gprs(model) -> CompiledGPRs:
+    """Compile the GPR rule of every reaction in a COBRApy model"""
+    gene_index: Dict[str, int] = {}
+    rxn_ids = []
+    programs = []
+
+    for rxn in model.reactions:
+        rule = rxn.gene_reaction_rule
+        if not rule or rule.isspace():
+            continue
+        try:
+            program = _gpr_to_postfix(rule, gene_index)
+        except GPRParseError as e:
+            logger.warning(f"Treating {rxn.id} as constitutive: {e}")
+            program = []
+        rxn_ids.append(rxn.id)
+        programs.append(program)
+
+    return CompiledGPRs(rxn_ids, programs, gene_index)
 
 
 # ============================================================================
 # Server Runner
 # ============================================================================
 
-def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False):
-    """Run the FastAPI server"""
-    try:
-        import uvicorn
-    except ImportError:
-        raise ImportError(
-            "Uvicorn is required to run the server. "
-            "Install with: pip install metabolicsuite[server]"
+# Imported / built on the first run_server call and reused afterwards
+_uvicorn = None
+_app = None
+
+
+def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = False, workers: int = 1):
+    """
+    Run the FastAPI server.
+
+    workers > 1 starts that many worker processes, so CPU-bound solves run
+    in parallel instead of sharing one GIL. Each worker builds its own app,
+    so model caches and solver sessions are per process: a model_token
+    registered in one worker is unknown to the others, and requests should
+    send the model itself (they are cached by content hash in every worker).
+    workers is ignored with reload, which always runs a single process.
+    """
+    global _uvicorn, _app
+    if _uvicorn is None:
+        try:
+            import uvicorn
+        except ImportError:
+            raise ImportError(
+                "Uvicorn is required to run the server. "
+                "Install with: pip install metabolicsuite[server]"
+            )
+        _uvicorn = uvicorn
+
+    # uvloop / httptools come with uvicorn[standard]; pick them explicitly when
+    # present so a missing C extension falls back to asyncio / h11 knowingly.
+    # The reloader keeps uvicorn's defaults.
+    options: Dict[str, Any] = {}
+    if not reload:
+        if importlib.util.find_spec("uvloop") is not None:
+            options["loop"] = "uvloop"
+        if importlib.util.find_spec("httptools") is not None:
+            options["http"] = "httptools"
+    logger.info(f"Event loop: {options.get('loop', 'auto')}, HTTP: {options.get('http', 'auto')}")
+
+    if reload or workers > 1:
+        # The reloader and worker processes import the app themselves
+        _uvicorn.run(
+            "metabolicsuite.api:create_app", factory=True, host=host, port=port,
+            reload=reload, workers=None if reload else workers, **options
         )
+        return
 
-    app = create_app()
-    uvicorn.run(app, host=host, port=port, reload=reload)
+    if _app is None:
+        _app = create_app()
+    _uvicorn.run(_app, host=host, port=port, **options)
 
 
 # Allow running directly
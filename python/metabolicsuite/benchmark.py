@@ -15,29 +15,58 @@ Reference:
 """
 
 import os
+import asyncio
 import json
 import time
 import logging
-import hashlib
+import operator
+import pickle
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import numpy as np
 
+from .solvers import set_solver
+
 try:
     import cobra
-    from cobra.io import load_json_model, read_sbml_model
+    from cobra.io import load_json_model
+    from cobra.flux_analysis.parsimonious import add_pfba
     COBRA_AVAILABLE = True
 except ImportError:
     COBRA_AVAILABLE = False
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,10 +85,55 @@ RESULTS_DIR = BENCHMARK_DIR / "results"
 OBJECTIVE_TOLERANCE = 1e-6  # Maximum allowed |Δobj|
 FLUX_TOLERANCE = 1e-4       # Maximum allowed individual flux difference
 
+# Memory budget for pickled models kept by COBRApyBenchmark.load_model
+MODEL_CACHE_MAX_BYTES = 1 << 30
 
-@dataclass
+# Below this many result pairs, process start-up costs more than comparing
+PARALLEL_COMPARE_MIN_PAIRS = 16
+
+
+def _http_session() -> "requests.Session":
+    """Keep-alive session with a connection pool sized for parallel downloads"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _dumps(obj) -> bytes:
+    """Indented JSON bytes, through orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2).encode()
+
+
+def _fluxes_to_pyfloat_dict(solution) -> Dict[str, float]:
+    """Reaction id -> flux as plain Python floats (JSON-serializable)"""
+    fluxes = solution.fluxes
+    return dict(zip(fluxes.index.tolist(), fluxes.to_numpy(dtype=np.float64).tolist()))
+
+
+def _shallow_asdict(obj, exclude: Tuple[str, ...] = ()) -> Dict:
+    """
+    dataclasses.asdict without the recursive deep copy: field values (flux
+    dicts included) are shared with obj, which is all a serializer needs.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj) if f.name not in exclude}
+
+
+def _flux_arrays(fluxes) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Reaction ids and an (n_reactions, k) float64 array from a flux Series/DataFrame"""
+    arr = fluxes.to_numpy(dtype=np.float64)
+    return tuple(fluxes.index.tolist()), arr.reshape(len(arr), -1)
+
+
+@dataclass(frozen=True)
 class ModelInfo:
-    """BiGG model metadata"""
+    """BiGG model metadata (hashable, so catalog selections can be memoized)"""
     bigg_id: str
     organism: str
     metabolite_count: int
@@ -78,6 +152,14 @@ class SolveResult:
     fluxes: Optional[Dict[str, float]]
     solve_time_ms: float
     error: Optional[str] = None
+    # Same fluxes as an (n_reactions, k) array in rxn_ids order (see _aligned),
+    # so comparing two solves of the same model skips the dict lookups
+    rxn_ids: Optional[Tuple[str, ...]] = field(default=None, compare=False, repr=False)
+    fluxes_arr: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
+
+
+# SolveResult fields that are only kept in memory, not exported
+_ARRAY_FIELDS = ("rxn_ids", "fluxes_arr")
 
 
 @dataclass
@@ -109,6 +191,7 @@ class BiGGModelCatalog:
         self.cache_dir = cache_dir or MODELS_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.catalog: List[ModelInfo] = []
+        self._session = _http_session() if REQUESTS_AVAILABLE else None
 
     def fetch_catalog(self, force_refresh: bool = False) -> List[ModelInfo]:
         """Fetch list of all available BiGG models"""
@@ -127,10 +210,13 @@ class BiGGModelCatalog:
 
         # Fetch from BiGG API
         logger.info("Fetching BiGG model catalog...")
-        response = requests.get(BIGG_MODELS_LIST, timeout=30)
+        response = self._session.get(BIGG_MODELS_LIST, timeout=30)
         response.raise_for_status()
 
-        data = response.json()
+        return self._store_catalog(response.json())
+
+    def _store_catalog(self, data: Dict) -> List[ModelInfo]:
+        """Build the catalog from a BiGG models listing and cache it"""
         self.catalog = []
 
         for model in data.get("results", []):
@@ -143,12 +229,32 @@ class BiGGModelCatalog:
             ))
 
         # Cache catalog
-        with open(catalog_file, "w") as f:
-            json.dump([asdict(m) for m in self.catalog], f, indent=2)
+        catalog = [_shallow_asdict(m) for m in self.catalog]
+        (self.cache_dir / "catalog.json").write_bytes(_dumps(catalog))
 
         logger.info(f"Fetched {len(self.catalog)} models from BiGG")
         return self.catalog
 
+    async def fetch_catalog_async(self, force_refresh: bool = False) -> List[ModelInfo]:
+        """
+        fetch_catalog for use inside an event loop.
+
+        Downloads with aiohttp when it is installed; cache hits (and the
+        download without aiohttp) run the blocking version in a thread.
+        """
+        catalog_file = self.cache_dir / "catalog.json"
+        if not AIOHTTP_AVAILABLE or (catalog_file.exists() and not force_refresh):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.fetch_catalog, force_refresh)
+
+        logger.info("Fetching BiGG model catalog...")
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession() as session:
+            async with session.get(BIGG_MODELS_LIST, timeout=timeout) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+        return self._store_catalog(data)
+
     def download_model(self, model_id: str, format: str = "json") -> Path:
         """Download a specific model from BiGG"""
         if not REQUESTS_AVAILABLE:
@@ -165,15 +271,110 @@ class BiGGModelCatalog:
         url = f"{BIGG_MODEL_DOWNLOAD}/{filename}"
         logger.info(f"Downloading {model_id} from BiGG...")
 
-        response = requests.get(url, timeout=120)
-        response.raise_for_status()
+        # Stream into a temporary file and rename, so a failed or concurrent
+        # download never leaves a truncated model in the cache
+        partial_path = filepath.with_name(f"{filename}.part")
+        with self._session.get(url, timeout=120, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(partial_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f)
+        os.replace(partial_path, filepath)
+
+        logger.info(f"Downloaded {model_id} ({filepath.stat().st_size / 1024:.1f} KB)")
+        return filepath
 
-        with open(filepath, "wb") as f:
-            f.write(response.content)
+    def download_models(self, model_ids: List[str], format: str = "json",
+                        max_workers: int = 8) -> Dict[str, Path]:
+        """
+        Download several models concurrently over the pooled session.
 
-        logger.info(f"Downloaded {model_id} ({len(response.content) / 1024:.1f} KB)")
+        Returns model id -> cached file for every model that is available;
+        failures are logged and left out.
+        """
+        def fetch(model_id: str) -> Optional[Path]:
+            try:
+                return self.download_model(model_id, format=format)
+            except Exception as e:
+                logger.error(f"Failed to load {model_id}: {e}")
+                return None
+
+        unique_ids = list(dict.fromkeys(model_ids))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_ids)))) as executor:
+            paths = executor.map(fetch, unique_ids)
+            return {model_id: path for model_id, path in zip(unique_ids, paths) if path is not None}
+
+    async def download_model_async(self, model_id: str, format: str = "json",
+                                   session: Optional["aiohttp.ClientSession"] = None) -> Path:
+        """download_model for use inside an event loop (aiohttp, or a thread)"""
+        if not AIOHTTP_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, partial(self.download_model, model_id, format))
+
+        ext = "json" if format == "json" else "xml"
+        filename = f"{model_id}.{ext}"
+        filepath = self.cache_dir / filename
+        if filepath.exists():
+            logger.debug(f"Model {model_id} already cached")
+            return filepath
+
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.download_model_async(model_id, format, own_session)
+
+        logger.info(f"Downloading {model_id} from BiGG...")
+        partial_path = filepath.with_name(f"{filename}.part")
+        url = f"{BIGG_MODEL_DOWNLOAD}/{filename}"
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=120)) as response:
+            response.raise_for_status()
+            with open(partial_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(1 << 16):
+                    f.write(chunk)
+        os.replace(partial_path, filepath)
+
+        logger.info(f"Downloaded {model_id} ({filepath.stat().st_size / 1024:.1f} KB)")
         return filepath
 
+    async def download_models_async(self, model_ids: List[str], format: str = "json",
+                                    max_concurrency: int = 16) -> Dict[str, Path]:
+        """
+        download_models on the event loop: up to max_concurrency downloads in
+        flight over one aiohttp session. Failures are logged and left out.
+        """
+        unique_ids = list(dict.fromkeys(model_ids))
+        if not AIOHTTP_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            download = partial(self.download_models, unique_ids, format)
+            return await loop.run_in_executor(None, download)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def fetch(model_id: str) -> Path:
+                async with semaphore:
+                    return await self.download_model_async(model_id, format, session)
+
+            outcomes = await asyncio.gather(*(fetch(m) for m in unique_ids), return_exceptions=True)
+
+        paths = {}
+        for model_id, outcome in zip(unique_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to load {model_id}: {outcome}")
+            else:
+                paths[model_id] = outcome
+        return paths
+
+    async def get_benchmark_models_async(self,
+                                         min_reactions: int = 10,
+                                         max_reactions: int = 5000,
+                                         limit: int = 100) -> List[ModelInfo]:
+        """get_benchmark_models, with the selected models downloaded concurrently"""
+        if not self.catalog:
+            await self.fetch_catalog_async()
+        selected = self.get_benchmark_models(min_reactions, max_reactions, limit)
+        await self.download_models_async([m.bigg_id for m in selected])
+        return selected
+
     def get_benchmark_models(self,
                              min_reactions: int = 10,
                              max_reactions: int = 5000,
@@ -187,9 +388,18 @@ class BiGGModelCatalog:
         if not self.catalog:
             self.fetch_catalog()
 
+        return list(self._select(tuple(self.catalog), min_reactions, max_reactions, limit))
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _select(catalog: Tuple[ModelInfo, ...],
+                min_reactions: int,
+                max_reactions: int,
+                limit: int) -> Tuple[ModelInfo, ...]:
+        """Size-filtered, stratified selection from a catalog snapshot"""
         # Filter by reaction count
         filtered = [
-            m for m in self.catalog
+            m for m in catalog
             if min_reactions <= m.reaction_count <= max_reactions
         ]
 
@@ -198,15 +408,10 @@ class BiGGModelCatalog:
 
         # Stratified sampling: small, medium, large
         if len(filtered) <= limit:
-            return filtered
-
-        step = len(filtered) / limit
-        selected = []
-        for i in range(limit):
-            idx = int(i * step)
-            selected.append(filtered[idx])
+            return tuple(filtered)
 
-        return selected
+        idx = np.linspace(0, len(filtered) - 1, limit, dtype=int)
+        return tuple(filtered[i] for i in idx.tolist())
 
 
 class COBRApyBenchmark:
@@ -219,44 +424,55 @@ class COBRApyBenchmark:
             raise RuntimeError("COBRApy required: pip install cobra")
         self.catalog = catalog
         self.results: List[SolveResult] = []
+        # bigg_id -> pickled model, least recently used first
+        self._model_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._model_cache_bytes = 0
 
     def load_model(self, model_id: str) -> Optional[cobra.Model]:
-        """Load a model from cache or download"""
+        """
+        Load a model from cache or download
+
+        Every call returns a fresh model with its own solver state. After the
+        first JSON parse the model is kept pickled in memory, and unpickling
+        is faster than parsing again.
+        """
+        cached = self._model_cache.get(model_id)
+        if cached is not None:
+            self._model_cache.move_to_end(model_id)
+            return pickle.loads(cached)
+
         try:
             filepath = self.catalog.download_model(model_id, format="json")
-            return load_json_model(str(filepath))
+            model = load_json_model(str(filepath))
         except Exception as e:
             logger.error(f"Failed to load {model_id}: {e}")
             return None
 
+        data = pickle.dumps(model, protocol=5)
+        self._model_cache[model_id] = data
+        self._model_cache_bytes += len(data)
+        while self._model_cache_bytes > MODEL_CACHE_MAX_BYTES and len(self._model_cache) > 1:
+            _, evicted = self._model_cache.popitem(last=False)
+            self._model_cache_bytes -= len(evicted)
+        return model
+
     def solve_fba(self, model: cobra.Model, solver: str = "glpk") -> SolveResult:
         """Run FBA on a model"""
         model_id = model.id
 
         try:
             # Set solver
-            model.solver = solver
+            set_solver(model, solver)
 
             start = time.perf_counter()
             solution = model.optimize()
             elapsed_ms = (time.perf_counter() - start) * 1000
 
             if solution.status == "optimal":
-                # Convert numpy dtypes to Python floats to avoid serialization issues
-                fluxes = {}
-                for rxn in model.reactions:
-                    val = solution.fluxes[rxn.id]
-                    # Handle numpy types by converting to Python float
-                    if hasattr(val, 'item'):
-                        fluxes[rxn.id] = float(val.item())
-                    else:
-                        fluxes[rxn.id] = float(val)
-
-                obj_val = solution.objective_value
-                if hasattr(obj_val, 'item'):
-                    obj_val = float(obj_val.item())
-                else:
-                    obj_val = float(obj_val)
+                rxn_ids, fluxes_arr = _flux_arrays(solution.fluxes)
+                fluxes = dict(zip(rxn_ids, fluxes_arr[:, 0].tolist()))
+
+                obj_val = float(solution.objective_value)
 
                 return SolveResult(
                     model_id=model_id,
@@ -266,6 +482,8 @@ class COBRApyBenchmark:
                     objective_value=obj_val,
                     fluxes=fluxes,
                     solve_time_ms=elapsed_ms,
+                    rxn_ids=rxn_ids,
+                    fluxes_arr=fluxes_arr,
                 )
             else:
                 return SolveResult(
@@ -294,26 +512,31 @@ class COBRApyBenchmark:
         model_id = model.id
 
         try:
-            model.solver = solver
+            set_solver(model, solver)
 
+            # The pFBA objective and constraint are undone when the context
+            # exits, so the model's LP is edited in place, not rebuilt
             start = time.perf_counter()
-            solution = cobra.flux_analysis.pfba(model)
+            with model:
+                add_pfba(model)
+                solution = model.optimize()
             elapsed_ms = (time.perf_counter() - start) * 1000
 
-            # Convert numpy dtypes to Python floats
-            fluxes = {}
-            for rxn in model.reactions:
-                val = solution.fluxes[rxn.id]
-                if hasattr(val, 'item'):
-                    fluxes[rxn.id] = float(val.item())
-                else:
-                    fluxes[rxn.id] = float(val)
-
-            obj_val = solution.objective_value
-            if hasattr(obj_val, 'item'):
-                obj_val = float(obj_val.item())
-            else:
-                obj_val = float(obj_val)
+            if solution.status != "optimal":
+                return SolveResult(
+                    model_id=model_id,
+                    method="pfba",
+                    solver=f"cobrapy-{solver}",
+                    status=solution.status,
+                    objective_value=None,
+                    fluxes=None,
+                    solve_time_ms=elapsed_ms,
+                )
+
+            rxn_ids, fluxes_arr = _flux_arrays(solution.fluxes)
+            fluxes = dict(zip(rxn_ids, fluxes_arr[:, 0].tolist()))
+
+            obj_val = float(solution.objective_value)
 
             return SolveResult(
                 model_id=model_id,
@@ -323,6 +546,8 @@ class COBRApyBenchmark:
                 objective_value=obj_val,
                 fluxes=fluxes,
                 solve_time_ms=elapsed_ms,
+                rxn_ids=rxn_ids,
+                fluxes_arr=fluxes_arr,
             )
         except Exception as e:
             return SolveResult(
@@ -343,7 +568,7 @@ class COBRApyBenchmark:
         model_id = model.id
 
         try:
-            model.solver = solver
+            set_solver(model, solver)
 
             start = time.perf_counter()
             fva_result = cobra.flux_analysis.flux_variability_analysis(
@@ -354,21 +579,11 @@ class COBRApyBenchmark:
             elapsed_ms = (time.perf_counter() - start) * 1000
 
             # Convert to dict format: {rxn_id: {"min": x, "max": y}}
-            # Handle numpy dtypes by converting to Python floats
-            fluxes = {}
-            for rxn_id in fva_result.index:
-                min_val = fva_result.loc[rxn_id, "minimum"]
-                max_val = fva_result.loc[rxn_id, "maximum"]
-                # Convert numpy types
-                if hasattr(min_val, 'item'):
-                    min_val = float(min_val.item())
-                else:
-                    min_val = float(min_val)
-                if hasattr(max_val, 'item'):
-                    max_val = float(max_val.item())
-                else:
-                    max_val = float(max_val)
-                fluxes[rxn_id] = {"min": min_val, "max": max_val}
+            rxn_ids, fluxes_arr = _flux_arrays(fva_result[["minimum", "maximum"]])
+            fluxes = {
+                rxn_id: {"min": lo, "max": hi}
+                for rxn_id, (lo, hi) in zip(rxn_ids, fluxes_arr.tolist())
+            }
 
             return SolveResult(
                 model_id=model_id,
@@ -378,6 +593,8 @@ class COBRApyBenchmark:
                 objective_value=None,  # FVA doesn't have single objective
                 fluxes=fluxes,
                 solve_time_ms=elapsed_ms,
+                rxn_ids=rxn_ids,
+                fluxes_arr=fluxes_arr,
             )
         except Exception as e:
             return SolveResult(
@@ -391,39 +608,74 @@ class COBRApyBenchmark:
                 error=str(e),
             )
 
+    def solve(self, model: cobra.Model, method: str, solver: str = "glpk") -> Optional[SolveResult]:
+        """Run one benchmark method ("fba", "pfba", "fva" or "fva_<percent>")"""
+        if method == "fba":
+            return self.solve_fba(model, solver)
+        if method == "pfba":
+            return self.solve_pfba(model, solver)
+        if method.startswith("fva"):
+            fraction = int(method.split("_")[1]) / 100 if "_" in method else 0.9
+            return self.solve_fva(model, fraction, solver)
+        logger.warning(f"Unknown method: {method}")
+        return None
+
     def run_benchmark(self,
                       models: List[ModelInfo],
                       methods: List[str] = ["fba", "pfba"],
-                      solvers: List[str] = ["glpk"]) -> List[SolveResult]:
+                      solvers: List[str] = ["glpk"],
+                      parallel: bool = True) -> List[SolveResult]:
         """
         Run full benchmark suite
+
+        With parallel, every (model, method, solver) solve runs as its own
+        task in a process pool, each on a freshly loaded model. Models are
+        downloaded up front so workers only read the cache. parallel=False
+        solves everything in this process, which is easier to debug.
         """
-        results = []
-        total = len(models) * len(methods) * len(solvers)
-        completed = 0
+        known = [m for m in methods if m in ("fba", "pfba") or m.startswith("fva")]
+        for method in set(methods) - set(known):
+            logger.warning(f"Unknown method: {method}")
 
+        available = self.catalog.download_models([m.bigg_id for m in models], format="json")
+        tasks = []
         for model_info in models:
-            model = self.load_model(model_info.bigg_id)
-            if model is None:
+            if model_info.bigg_id not in available:
                 continue
-
-            for method in methods:
+            for method in known:
                 for solver in solvers:
-                    completed += 1
-                    logger.info(f"[{completed}/{total}] {model_info.bigg_id} - {method} ({solver})")
-
-                    if method == "fba":
-                        result = self.solve_fba(model, solver)
-                    elif method == "pfba":
-                        result = self.solve_pfba(model, solver)
-                    elif method.startswith("fva"):
-                        fraction = int(method.split("_")[1]) / 100 if "_" in method else 0.9
-                        result = self.solve_fva(model, fraction, solver)
-                    else:
-                        logger.warning(f"Unknown method: {method}")
-                        continue
+                    tasks.append((model_info.bigg_id, method, solver))
+
+        total = len(tasks)
+        workers = min(total, os.cpu_count() or 1)
+        results = []
 
-                    results.append(result)
+        if parallel and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = executor.map(
+                    partial(_solve_one, cache_dir=self.catalog.cache_dir), *zip(*tasks), chunksize=1
+                )
+                for completed, (task, result) in enumerate(zip(tasks, outcomes), 1):
+                    logger.info(f"[{completed}/{total}] {task[0]} - {task[1]} ({task[2]})")
+                    if result is not None:
+                        results.append(SolveResult(**result))
+        else:
+            # A fresh model per solve, so earlier methods (and solver
+            # switches) leave no state behind in the LP. The next task's model
+            # is loaded on a background thread while the current one solves;
+            # one loader thread keeps load_model's cache single-threaded.
+            with ThreadPoolExecutor(max_workers=1) as prefetch:
+                pending = prefetch.submit(self.load_model, tasks[0][0]) if tasks else None
+                for completed, (model_id, method, solver) in enumerate(tasks, 1):
+                    logger.info(f"[{completed}/{total}] {model_id} - {method} ({solver})")
+                    model = pending.result()
+                    if completed < total:
+                        pending = prefetch.submit(self.load_model, tasks[completed][0])
+                    if model is None:
+                        continue
+                    result = self.solve(model, method, solver)
+                    if result is not None:
+                        results.append(result)
 
         self.results = results
         return results
@@ -431,11 +683,75 @@ class COBRApyBenchmark:
     def export_results(self, filepath: Path) -> None:
         """Export results to JSON"""
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump([asdict(r) for r in self.results], f, indent=2)
+        records = [_shallow_asdict(r, exclude=_ARRAY_FIELDS) for r in self.results]
+        filepath.write_bytes(_dumps(records))
         logger.info(f"Exported {len(self.results)} results to {filepath}")
 
 
+# Per worker process, so a worker that gets several tasks for the same model
+# unpickles it instead of parsing the JSON again
+_worker_benchmarks: Dict[Path, "COBRApyBenchmark"] = {}
+
+
+def _solve_one(model_id: str, method: str, solver: str, cache_dir: Path) -> Optional[Dict]:
+    """Process-pool task: load one cached model and run one method on it"""
+    benchmark = _worker_benchmarks.get(cache_dir)
+    if benchmark is None:
+        benchmark = _worker_benchmarks[cache_dir] = COBRApyBenchmark(BiGGModelCatalog(cache_dir))
+    model = benchmark.load_model(model_id)
+    if model is None:
+        return None
+    result = benchmark.solve(model, method, solver)
+    return _shallow_asdict(result) if result is not None else None
+
+
+def _aligned(fluxes: Dict, rxn_ids: List[str]) -> np.ndarray:
+    """
+    Fluxes as an (n_reactions, k) array in rxn_ids order: one column for
+    FBA/pFBA fluxes, min and max columns for FVA ranges.
+    """
+    n = len(rxn_ids)
+    if isinstance(fluxes[rxn_ids[0]], dict):
+        values = (bound for r in rxn_ids for bound in (fluxes[r]["min"], fluxes[r]["max"]))
+        return np.fromiter(values, dtype=np.float64, count=2 * n).reshape(n, 2)
+    return np.fromiter((fluxes[r] for r in rxn_ids), dtype=np.float64, count=n).reshape(n, 1)
+
+
+def _flux_stats_numpy(a: np.ndarray, b: np.ndarray) -> Tuple[float, float, int]:
+    """(L2 norm, max, argmax) of the per-reaction difference max_k |a - b|"""
+    diff = np.abs(a - b).max(axis=1)
+    i = int(diff.argmax())
+    return float(np.sqrt(diff @ diff)), float(diff[i]), i
+
+
+def _flux_stats_loop(a, b):
+    """_flux_stats_numpy as one pass over both arrays, for numba"""
+    sqsum = 0.0
+    maxv = 0.0
+    maxi = 0
+    for i in range(a.shape[0]):
+        d = 0.0
+        for k in range(a.shape[1]):
+            dk = abs(a[i, k] - b[i, k])
+            if dk > d:
+                d = dk
+        sqsum += d * d
+        if d > maxv:
+            maxv = d
+            maxi = i
+    return np.sqrt(sqsum), maxv, maxi
+
+
+if NUMBA_AVAILABLE:
+    _flux_stats = numba.njit(cache=True, fastmath=True)(_flux_stats_loop)
+else:
+    _flux_stats = _flux_stats_numpy
+
+
+# Per-comparison fields generate_summary reduces over (NaN where missing)
+_SUMMARY_DTYPE = np.dtype([("passed", np.bool_), ("obj_diff", np.float64), ("flux_l2", np.float64)])
+
+
 class BenchmarkComparator:
     """
     Compare results between different solvers
@@ -443,6 +759,7 @@ class BenchmarkComparator:
 
     def __init__(self):
         self.comparisons: List[ComparisonResult] = []
+        self._summary: Optional[Dict] = None
 
     def compare(self,
                 result_a: SolveResult,
@@ -480,32 +797,27 @@ class BenchmarkComparator:
         flux_max = None
         flux_max_rxn = None
 
-        if result_a.fluxes and result_b.fluxes:
+        ids_a, ids_b = result_a.rxn_ids, result_b.rxn_ids
+        if (ids_a is not None and ids_b is not None
+                and result_a.fluxes_arr.shape == result_b.fluxes_arr.shape
+                and (ids_a is ids_b or ids_a == ids_b)):
+            # Same model, same reaction order: compare the arrays directly
+            if ids_a:
+                l2, max_diff, i = _flux_stats(result_a.fluxes_arr, result_b.fluxes_arr)
+                flux_l2 = float(l2)
+                flux_max = float(max_diff)
+                flux_max_rxn = ids_a[i] if flux_max > 0 else None
+        elif result_a.fluxes and result_b.fluxes:
             common_rxns = set(result_a.fluxes.keys()) & set(result_b.fluxes.keys())
 
             if common_rxns:
-                diffs = []
-                max_diff = 0
-                max_rxn = None
-
-                for rxn in common_rxns:
-                    fa = result_a.fluxes[rxn]
-                    fb = result_b.fluxes[rxn]
-
-                    # Handle FVA results (dict with min/max)
-                    if isinstance(fa, dict):
-                        diff = max(abs(fa["min"] - fb["min"]), abs(fa["max"] - fb["max"]))
-                    else:
-                        diff = abs(fa - fb)
-
-                    diffs.append(diff ** 2)
-                    if diff > max_diff:
-                        max_diff = diff
-                        max_rxn = rxn
-
-                flux_l2 = np.sqrt(sum(diffs))
-                flux_max = max_diff
-                flux_max_rxn = max_rxn
+                rxn_list = sorted(common_rxns)
+                l2, max_diff, i = _flux_stats(
+                    _aligned(result_a.fluxes, rxn_list), _aligned(result_b.fluxes, rxn_list)
+                )
+                flux_l2 = float(l2)
+                flux_max = float(max_diff)
+                flux_max_rxn = rxn_list[i] if flux_max > 0 else None
 
         # Determine pass/fail
         passed = obj_diff < OBJECTIVE_TOLERANCE
@@ -535,53 +847,108 @@ class BenchmarkComparator:
 
     def compare_result_sets(self,
                             results_a: List[SolveResult],
-                            results_b: List[SolveResult]) -> List[ComparisonResult]:
-        """Compare two sets of results"""
+                            results_b: List[SolveResult],
+                            parallel: bool = True) -> List[ComparisonResult]:
+        """
+        Compare two sets of results
+
+        Pairs are independent, so with parallel (and at least
+        PARALLEL_COMPARE_MIN_PAIRS of them) they are compared in a process pool.
+        """
 
         # Index by (model_id, method)
         index_a = {(r.model_id, r.method): r for r in results_a}
         index_b = {(r.model_id, r.method): r for r in results_b}
 
         common_keys = set(index_a.keys()) & set(index_b.keys())
+        pairs = [(index_a[key], index_b[key]) for key in sorted(common_keys)]
 
-        comparisons = []
-        for key in sorted(common_keys):
-            comp = self.compare(index_a[key], index_b[key])
-            comparisons.append(comp)
+        workers = os.cpu_count() or 1
+        if parallel and workers > 1 and len(pairs) >= PARALLEL_COMPARE_MIN_PAIRS:
+            chunksize = max(1, len(pairs) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                comparisons = list(executor.map(_compare_pair, pairs, chunksize=chunksize))
+        else:
+            comparisons = [self.compare(a, b) for a, b in pairs]
 
         self.comparisons = comparisons
+        self._summary = None
         return comparisons
 
     def generate_summary(self) -> Dict:
-        """Generate summary statistics"""
+        """
+        Generate summary statistics
+
+        Computed in one pass over the comparisons and cached until the next
+        compare_result_sets call.
+        """
         if not self.comparisons:
             return {}
+        if self._summary is not None:
+            return self._summary
 
         total = len(self.comparisons)
-        passed = sum(1 for c in self.comparisons if c.passed)
+        nan = float("nan")
+        stats = np.fromiter(
+            ((c.passed,
+              nan if c.obj_diff is None else c.obj_diff,
+              nan if c.flux_l2_norm is None else c.flux_l2_norm)
+             for c in self.comparisons),
+            dtype=_SUMMARY_DTYPE,
+            count=total,
+        )
+        passed = int(np.count_nonzero(stats["passed"]))
         failed = total - passed
 
-        obj_diffs = [c.obj_diff for c in self.comparisons if c.obj_diff is not None]
-        flux_l2s = [c.flux_l2_norm for c in self.comparisons if c.flux_l2_norm is not None]
+        # None entries became NaN
+        obj_diffs = stats["obj_diff"]
+        obj_diffs = obj_diffs[~np.isnan(obj_diffs)]
+        flux_l2s = stats["flux_l2"]
+        flux_l2s = flux_l2s[~np.isnan(flux_l2s)]
+        has_obj = obj_diffs.size > 0
+        has_flux = flux_l2s.size > 0
 
-        return {
+        self._summary = {
             "total_comparisons": total,
             "passed": passed,
             "failed": failed,
             "pass_rate": passed / total if total > 0 else 0,
             "objective_diff": {
-                "mean": np.mean(obj_diffs) if obj_diffs else None,
-                "std": np.std(obj_diffs) if obj_diffs else None,
-                "max": max(obj_diffs) if obj_diffs else None,
-                "min": min(obj_diffs) if obj_diffs else None,
+                "mean": obj_diffs.mean() if has_obj else None,
+                "std": obj_diffs.std() if has_obj else None,
+                "max": float(obj_diffs.max()) if has_obj else None,
+                "min": float(obj_diffs.min()) if has_obj else None,
             },
             "flux_l2_norm": {
-                "mean": np.mean(flux_l2s) if flux_l2s else None,
-                "std": np.std(flux_l2s) if flux_l2s else None,
-                "max": max(flux_l2s) if flux_l2s else None,
+                "mean": flux_l2s.mean() if has_flux else None,
+                "std": flux_l2s.std() if has_flux else None,
+                "max": float(flux_l2s.max()) if has_flux else None,
             },
             "timestamp": datetime.now().isoformat(),
         }
+        return self._summary
+
+
+def _compare_pair(pair: Tuple[SolveResult, SolveResult]) -> ComparisonResult:
+    """Process-pool task for compare_result_sets"""
+    return BenchmarkComparator().compare(*pair)
+
+
+_row_fields = operator.attrgetter(
+    "model_id", "method", "obj_diff", "flux_l2_norm", "time_a_ms", "time_b_ms", "passed"
+)
+
+
+def _fmt_row(c: ComparisonResult) -> str:
+    """One generate_detailed_table row"""
+    model_id, method, obj_diff, flux_l2, time_a, time_b, passed = _row_fields(c)
+    status = "\\checkmark" if passed else "\\texttimes"
+    obj_diff = f"{obj_diff:.2e}" if obj_diff else "--"
+    flux_l2 = f"{flux_l2:.2e}" if flux_l2 else "--"
+    return (
+        f"  {model_id} & {method} & {obj_diff} & {flux_l2} & "
+        f"{time_a:.1f} & {time_b:.1f} & {status} \\\\"
+    )
 
 
 class LaTeXReportGenerator:
@@ -625,16 +992,7 @@ Max $||\\Delta v||_2$ & {s['flux_l2_norm']['max']:.2e} & -- \\\\
     def generate_detailed_table(self, max_rows: int = 20) -> str:
         """Generate detailed comparison table"""
 
-        rows = []
-        for c in self.comparisons[:max_rows]:
-            status = "\\checkmark" if c.passed else "\\texttimes"
-            obj_diff = f"{c.obj_diff:.2e}" if c.obj_diff else "--"
-            flux_l2 = f"{c.flux_l2_norm:.2e}" if c.flux_l2_norm else "--"
-
-            rows.append(
-                f"  {c.model_id} & {c.method} & {obj_diff} & {flux_l2} & "
-                f"{c.time_a_ms:.1f} & {c.time_b_ms:.1f} & {status} \\\\"
-            )
+        rows = "\n".join(map(_fmt_row, self.comparisons[:max_rows]))
 
         return f"""
 \\begin{{table}}[htbp]
@@ -647,7 +1005,7 @@ Max $||\\Delta v||_2$ & {s['flux_l2_norm']['max']:.2e} & -- \\\\
 \\textbf{{$||\\Delta v||_2$}} & \\textbf{{t$_{{HiGHS}}$}} &
 \\textbf{{t$_{{COBRApy}}$}} & \\textbf{{Pass}} \\\\
 \\midrule
-{chr(10).join(rows)}
+{rows}
 \\bottomrule
 \\end{{tabular}}
 \\end{{table}}
@@ -728,22 +1086,26 @@ async def run_cobrapy_benchmark(model_json: Dict,
 
     try:
         # Create model from JSON
-        import io
-        from cobra.io import load_json_model
-
         model = cobra.Model()
 
-        # Parse metabolites
+        # Parse metabolites (first definition of an id wins, as add_metabolites
+        # would skip later ones)
+        met_by_id = {}
         for met_data in model_json.get("metabolites", []):
-            met = cobra.Metabolite(
-                id=met_data["id"],
-                name=met_data.get("name", met_data["id"]),
-                compartment=met_data.get("compartment", "c"),
-            )
-            model.add_metabolites([met])
+            if met_data["id"] not in met_by_id:
+                met_by_id[met_data["id"]] = cobra.Metabolite(
+                    id=met_data["id"],
+                    name=met_data.get("name", met_data["id"]),
+                    compartment=met_data.get("compartment", "c"),
+                )
+        model.add_metabolites(list(met_by_id.values()))
 
-        # Parse reactions
+        # Parse reactions, then add them to the model in one call
+        reactions = {}
+        objective = {}
         for rxn_data in model_json.get("reactions", []):
+            if rxn_data["id"] in reactions:
+                continue
             rxn = cobra.Reaction(
                 id=rxn_data["id"],
                 name=rxn_data.get("name", rxn_data["id"]),
@@ -752,20 +1114,24 @@ async def run_cobrapy_benchmark(model_json: Dict,
             )
 
             # Add metabolites
-            metabolites = {}
-            for met_id, coef in rxn_data.get("metabolites", {}).items():
-                if met_id in model.metabolites:
-                    metabolites[model.metabolites.get_by_id(met_id)] = coef
-            rxn.add_metabolites(metabolites)
+            rxn.add_metabolites({
+                met_by_id[met_id]: coef
+                for met_id, coef in rxn_data.get("metabolites", {}).items()
+                if met_id in met_by_id
+            })
+            reactions[rxn.id] = rxn
 
-            # Set objective
             if rxn_data.get("objective_coefficient", 0) != 0:
-                rxn.objective_coefficient = rxn_data["objective_coefficient"]
+                objective[rxn] = rxn_data["objective_coefficient"]
+
+        model.add_reactions(list(reactions.values()))
 
-            model.add_reactions([rxn])
+        # Set objective (only possible once the reactions belong to the model)
+        if objective:
+            model.objective = objective
 
         # Set solver
-        model.solver = solver
+        set_solver(model, solver)
 
         # Run solve
         start = time.perf_counter()
@@ -780,19 +1146,9 @@ async def run_cobrapy_benchmark(model_json: Dict,
         elapsed_ms = (time.perf_counter() - start) * 1000
 
         if solution.status == "optimal":
-            # Convert numpy dtypes to Python floats for JSON serialization
-            fluxes = {}
-            for rxn_id, val in solution.fluxes.items():
-                if hasattr(val, 'item'):
-                    fluxes[rxn_id] = float(val.item())
-                else:
-                    fluxes[rxn_id] = float(val)
-
-            obj_val = solution.objective_value
-            if hasattr(obj_val, 'item'):
-                obj_val = float(obj_val.item())
-            else:
-                obj_val = float(obj_val)
+            fluxes = _fluxes_to_pyfloat_dict(solution)
+
+            obj_val = float(solution.objective_value)
 
             return {
                 "status": "optimal",
@@ -820,7 +1176,8 @@ async def run_cobrapy_benchmark(model_json: Dict,
 
 def run_full_benchmark(num_models: int = 100,
                        methods: List[str] = ["fba", "pfba"],
-                       output_dir: Optional[Path] = None) -> Dict:
+                       output_dir: Optional[Path] = None,
+                       parallel: bool = True) -> Dict:
     """
     Run complete benchmark suite
 
@@ -837,7 +1194,7 @@ def run_full_benchmark(num_models: int = 100,
 
     # Run COBRApy benchmark
     benchmark = COBRApyBenchmark(catalog)
-    results = benchmark.run_benchmark(models, methods=methods)
+    results = benchmark.run_benchmark(models, methods=methods, parallel=parallel)
 
     # Save results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -871,6 +1228,8 @@ if __name__ == "__main__":
                         help="Methods to benchmark")
     parser.add_argument("-o", "--output", type=Path, default=None,
                         help="Output directory")
+    parser.add_argument("--serial", action="store_true",
+                        help="Solve in this process instead of a process pool")
 
     args = parser.parse_args()
 
@@ -878,8 +1237,9 @@ if __name__ == "__main__":
         num_models=args.num_models,
         methods=args.methods,
         output_dir=args.output,
+        parallel=not args.serial,
     )
 
-    print(f"\nBenchmark Complete!")
+    print("\nBenchmark Complete!")
     print(f"Results: {result['results_file']}")
     print(f"Summary: {result['summary']}")
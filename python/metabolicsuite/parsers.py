@@ -2,11 +2,46 @@
 Parsers for metabolic models and omics data.
 """
 
+from __future__ import annotations
+
+import importlib.util
 import json
+import math
 import pathlib
-from typing import Any, Dict, Optional, Union
+import pickle
+import re
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+# numpy and pandas are imported where omics data is handled, so importing
+# the package (or parse_model alone) does not pay for them
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow's multi-threaded CSV reader is used when installed
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Rust-backed Excel reader (pandas >= 2.2, engine='calamine')
+CALAMINE_AVAILABLE = importlib.util.find_spec("python_calamine") is not None
+
+# numba is imported only once a frame is large enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Below this many values NumPy's reductions finish before numba would load
+_NUMBA_STATS_MIN_VALUES = 1_000_000
 
-import pandas as pd
+# Cytosol/extracellular suffix dropped from metabolite ids in equation strings
+_COMPARTMENT_SUFFIX_RE = re.compile(r'_[ce]$')
+
+_GPR_TOKEN_RE = re.compile(r'[a-zA-Z0-9_.-]+')
+_GPR_KEYWORDS = frozenset(('AND', 'OR'))
 
 
 def parse_model(source: Union[str, pathlib.Path, Dict]) -> Dict:
@@ -26,6 +61,11 @@ def parse_model(source: Union[str, pathlib.Path, Dict]) -> Dict:
     dict
         Standardized model dictionary with reactions, metabolites, genes.
 
+    Notes
+    -----
+    The last few model files parsed are cached until their modification time
+    or size changes; every call still returns an independent copy.
+
     Examples
     --------
     >>> model = parse_model("iML1515.xml")
@@ -45,15 +85,38 @@ def parse_model(source: Union[str, pathlib.Path, Dict]) -> Dict:
     if not path.exists():
         raise FileNotFoundError(f"Model file not found: {path}")
 
-    content = path.read_text()
-
-    if path.suffix.lower() in ['.xml', '.sbml']:
-        return _parse_sbml(content)
-    elif path.suffix.lower() == '.json':
-        data = json.loads(content)
-        return _standardize_dict_model(data)
-    else:
+    if path.suffix.lower() not in _MODEL_READERS:
         raise ValueError(f"Unsupported file format: {path.suffix}")
+    stat = path.stat()
+    return pickle.loads(_parse_model_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _parse_model_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Parsed model file, pickled. Keyed on mtime and size so a re-saved
+    file is parsed again; unpickling gives each caller its own copy
+    faster than deepcopy (or parsing) would.
+    """
+    path = pathlib.Path(path)
+    model = _MODEL_READERS[path.suffix.lower()](path)
+    return pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _parse_json_model(path: pathlib.Path) -> Dict:
+    """Parse a CobraPy JSON model file."""
+    return _standardize_dict_model(_load_json(path.read_bytes()))
+
+
+def _load_json(content: bytes) -> Any:
+    """Decode JSON bytes, through orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, which only the json module accepts
+            pass
+    return json.loads(content)
 
 
 def _parse_cobra_model(model: Any) -> Dict:
@@ -145,8 +208,8 @@ def _standardize_dict_model(data: Dict) -> Dict:
     return result
 
 
-def _parse_sbml(content: str) -> Dict:
-    """Parse SBML XML content."""
+def _parse_sbml(path: pathlib.Path) -> Dict:
+    """Parse an SBML XML file (read by the parser itself, so it can stream)."""
     # For now, recommend using web interface for SBML
     # Full SBML parsing would require lxml or similar
     raise NotImplementedError(
@@ -156,17 +219,26 @@ def _parse_sbml(content: str) -> Dict:
     )
 
 
+# Model file suffix -> reader taking the path
+_MODEL_READERS = {
+    '.xml': _parse_sbml,
+    '.sbml': _parse_sbml,
+    '.json': _parse_json_model,
+}
+
+
 def _build_equation(metabolites: Dict) -> str:
     """Build reaction equation string from metabolites dict."""
     reactants = []
     products = []
 
     for met_id, coeff in metabolites.items():
-        name = met_id.replace('_c', '').replace('_e', '')
+        name = _COMPARTMENT_SUFFIX_RE.sub('', met_id)
         if coeff < 0:
-            reactants.append(f"{abs(coeff)} {name}" if abs(coeff) != 1 else name)
+            coeff = -coeff
+            reactants.append(name if coeff == 1 else f"{coeff} {name}")
         else:
-            products.append(f"{coeff} {name}" if coeff != 1 else name)
+            products.append(name if coeff == 1 else f"{coeff} {name}")
 
     return f"{' + '.join(reactants) or '∅'} → {' + '.join(products) or '∅'}"
 
@@ -175,15 +247,18 @@ def _parse_gpr_genes(gpr: str) -> list:
     """Extract gene IDs from GPR string."""
     if not gpr:
         return []
-    import re
-    genes = re.findall(r'[a-zA-Z0-9_.-]+', gpr)
-    return [g for g in genes if g.upper() not in ('AND', 'OR')]
+    # Most rules are a single gene id; spaces or parentheses rule that out
+    # before the regex runs
+    if ' ' not in gpr and '(' not in gpr and ')' not in gpr and _GPR_TOKEN_RE.fullmatch(gpr):
+        return [] if gpr.upper() in _GPR_KEYWORDS else [gpr]
+    return [g for g in _GPR_TOKEN_RE.findall(gpr) if g.upper() not in _GPR_KEYWORDS]
 
 
 def parse_omics_data(
     source: Union[str, pathlib.Path, pd.DataFrame, Dict],
     id_col: Optional[str] = None,
-    value_cols: Optional[list] = None
+    value_cols: Optional[list] = None,
+    dtype_backend: Optional[str] = None
 ) -> Dict:
     """
     Parse omics data from various sources.
@@ -191,22 +266,31 @@ def parse_omics_data(
     Parameters
     ----------
     source : str, Path, DataFrame, or dict
-        Omics data source.
+        Omics data source. Files may be .csv, .tsv/.txt, .xlsx or .parquet.
     id_col : str, optional
         Column name for identifiers. Auto-detected if not provided.
     value_cols : list, optional
         Column names for values. Auto-detected if not provided.
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, optional
+        Passed to the pandas reader for file sources (pandas >= 2.0).
+        Default keeps NumPy-backed columns.
 
     Returns
     -------
     dict
-        Standardized omics data dictionary.
+        Standardized omics data dictionary. ``data`` maps each id to its
+        non-missing {column: value} pairs; ``matrix`` holds the same values
+        as a dense float64 array (rows in ``ids`` order, columns in
+        ``value_columns`` order, NaN where missing) for vectorized use.
 
     Examples
     --------
     >>> data = parse_omics_data("deseq2_results.csv", id_col="gene", value_cols=["log2FoldChange"])
     >>> data = parse_omics_data(df, id_col="metabolite", value_cols=["wt", "mutant"])
     """
+    import numpy as np
+    import pandas as pd
+
     # Load data
     if isinstance(source, pd.DataFrame):
         df = source
@@ -214,62 +298,158 @@ def parse_omics_data(
         df = pd.DataFrame(source)
     else:
         path = pathlib.Path(source)
-        if path.suffix.lower() in ['.csv']:
-            df = pd.read_csv(path)
-        elif path.suffix.lower() in ['.tsv', '.txt']:
-            df = pd.read_csv(path, sep='\t')
-        elif path.suffix.lower() == '.xlsx':
-            df = pd.read_excel(path)
-        else:
+        reader = _OMICS_READERS.get(path.suffix.lower())
+        if reader is None:
             raise ValueError(f"Unsupported file format: {path.suffix}")
+        options = {'dtype_backend': dtype_backend} if dtype_backend else {}
+        if id_col is not None and value_cols is not None:
+            # Nothing to auto-detect, so only these columns are parsed
+            options['usecols'] = list(dict.fromkeys([id_col, *value_cols]))
+        df = reader(path, options)
 
     # Auto-detect ID column
     if id_col is None:
         id_patterns = ['gene', 'protein', 'metabolite', 'reaction', 'id', 'name']
+        lowered = [(c.lower(), c) for c in df.columns]
         for pattern in id_patterns:
-            matches = [c for c in df.columns if pattern.lower() in c.lower()]
+            matches = [c for low, c in lowered if pattern in low]
             if matches:
                 id_col = matches[0]
                 break
         if id_col is None:
             id_col = df.columns[0]
 
-    # Auto-detect value columns
+    # Auto-detect value columns (any numeric dtype, nullable and Arrow included)
     if value_cols is None:
-        value_cols = [c for c in df.columns if c != id_col and df[c].dtype in ['float64', 'int64']]
+        value_cols = [c for c in df.select_dtypes(include='number').columns if c != id_col]
 
-    # Build indexed data
-    indexed = {}
-    for _, row in df.iterrows():
-        item_id = str(row[id_col])
-        indexed[item_id] = {col: float(row[col]) for col in value_cols if pd.notna(row[col])}
+    # Build indexed data, skipping missing values
+    ids = df[id_col].astype(str).tolist()
+    matrix = df[value_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    indexed = _index_values(ids, matrix, value_cols)
 
     return {
         'data': indexed,
+        'ids': ids,
+        'matrix': matrix,
         'id_column': id_col,
         'value_columns': value_cols,
         'conditions': value_cols,
-        'stats': _calculate_stats(df, value_cols)
+        'stats': _calculate_stats(matrix)
     }
 
 
-def _calculate_stats(df: pd.DataFrame, value_cols: list) -> Dict:
-    """Calculate statistics for value columns."""
-    all_values = []
-    for col in value_cols:
-        all_values.extend(df[col].dropna().tolist())
+def _read_csv(path: pathlib.Path, options: Dict, sep: str = ',') -> pd.DataFrame:
+    """Read a delimited file, through the pyarrow engine when available."""
+    import pandas as pd
 
-    if not all_values:
-        return {}
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(path, sep=sep, engine='pyarrow', **options)
+        except (ImportError, ValueError):
+            # pyarrow too old for this pandas, or a file it cannot parse
+            pass
+    return pd.read_csv(path, sep=sep, **options)
 
+
+def _read_excel(path: pathlib.Path, options: Dict) -> pd.DataFrame:
+    """Read the first sheet of an Excel workbook, through calamine when available."""
+    import pandas as pd
+
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(path, engine='calamine', **options)
+        except (ImportError, ValueError):
+            # pandas older than 2.2, or a workbook calamine cannot read
+            pass
+    return pd.read_excel(path, **options)
+
+
+def _read_parquet(path: pathlib.Path, options: Dict) -> pd.DataFrame:
+    """Read a Parquet file (needs pyarrow or fastparquet)."""
+    import pandas as pd
+
+    options = dict(options)
+    if 'usecols' in options:
+        options['columns'] = options.pop('usecols')
+    return pd.read_parquet(path, **options)
+
+
+# Omics file suffix -> reader taking the path and pandas reader kwargs
+# (dtype_backend, usecols)
+_OMICS_READERS = {
+    '.csv': _read_csv,
+    '.tsv': partial(_read_csv, sep='\t'),
+    '.txt': partial(_read_csv, sep='\t'),
+    '.xlsx': _read_excel,
+    '.parquet': _read_parquet,
+}
+
+
+def _index_values(ids: list, values: np.ndarray, value_cols: list) -> Dict:
+    """Map each id to {column: value} over one row of a 2-D float array."""
     import numpy as np
-    arr = np.array(all_values)
 
+    rows = values.tolist()
+    present = ~np.isnan(values)
+    if present.all():
+        return {item_id: dict(zip(value_cols, row)) for item_id, row in zip(ids, rows)}
     return {
-        'min': float(np.min(arr)),
-        'max': float(np.max(arr)),
-        'mean': float(np.mean(arr)),
+        item_id: {col: v for col, v, keep in zip(value_cols, row, mask) if keep}
+        for item_id, row, mask in zip(ids, rows, present.tolist())
+    }
+
+
+def _calculate_stats(values: np.ndarray) -> Dict:
+    """Calculate statistics over a float value matrix, ignoring NaNs."""
+    import numpy as np
+
+    arr = values[~np.isnan(values)]
+
+    if arr.size == 0:
+        return {}
+
+    if NUMBA_AVAILABLE and arr.size >= _NUMBA_STATS_MIN_VALUES:
+        mn, mx, mean, std = _moments_kernel()(arr)
+    else:
+        mn, mx, mean, std = arr.min(), arr.max(), arr.mean(), arr.std()
+
+    return {
+        'min': float(mn),
+        'max': float(mx),
+        'mean': float(mean),
         'median': float(np.median(arr)),
-        'std': float(np.std(arr)),
+        'std': float(std),
         'count': len(arr)
     }
+
+
+def _moments_loop(arr):
+    """
+    Min, max, mean and population std of a NaN-free 1-D array in one pass.
+
+    Sums are taken relative to the first value, which keeps the
+    sum-of-squares variance accurate when values are large.
+    """
+    n = arr.shape[0]
+    shift = arr[0]
+    mn = shift
+    mx = shift
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = arr[i]
+        mn = min(mn, v)
+        mx = max(mx, v)
+        d = v - shift
+        s += d
+        s2 += d * d
+    mean = s / n
+    return mn, mx, shift + mean, math.sqrt(max(s2 / n - mean * mean, 0.0))
+
+
+@lru_cache(maxsize=None)
+def _moments_kernel():
+    """_moments_loop compiled with numba, on first use."""
+    import numba
+    return numba.njit(cache=True, fastmath=True)(_moments_loop)
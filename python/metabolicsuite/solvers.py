@@ -0,0 +1,24 @@
+"""
+Solver switching shared by the API server and the benchmark suite.
+
+Kept free of the benchmark harness and server dependencies so either side can
+import it without pulling in the other.
+"""
+
+
+def set_solver(model, solver: str):
+    """
+    Switch model to solver unless it already uses it.
+
+    Switching rebuilds the whole optlang problem. optlang's HiGHS interface
+    also reports "no time limit" as 0, which the switch hands to the new
+    interface as a zero-second limit; that is cleared here.
+    """
+    from cobra.util.solver import interface_to_str
+
+    if interface_to_str(model.problem) != solver:
+        timeout = model.solver.configuration.timeout
+        model.solver = solver
+        if not timeout:
+            model.solver.configuration.timeout = None
+    return model
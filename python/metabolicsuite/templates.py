@@ -2,6 +2,7 @@
 Pre-built pathway templates for quick visualization.
 """
 
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 # Template definitions (mirrors JavaScript templates)
@@ -138,6 +139,33 @@ TEMPLATES = {
 }
 
 
+def _freeze(template: Dict) -> MappingProxyType:
+    """Read-only view of a template, with nodes and edges as tuples of views."""
+    return MappingProxyType({
+        **template,
+        'nodes': tuple(MappingProxyType(n) for n in template['nodes']),
+        'edges': tuple(MappingProxyType(e) for e in template['edges']),
+    })
+
+
+# Shared by every caller, so frozen; get_template hands out copies
+TEMPLATES = MappingProxyType({name: _freeze(t) for name, t in TEMPLATES.items()})
+
+# Template metadata for list_templates, and the names for get_template errors
+_TEMPLATE_INDEX = tuple(
+    MappingProxyType({
+        'id': t['id'],
+        'name': t['name'],
+        'organism': t['organism'],
+        'description': t['description'],
+        'node_count': len(t['nodes']),
+        'edge_count': len(t['edges'])
+    })
+    for t in TEMPLATES.values()
+)
+_TEMPLATE_NAMES = ', '.join(TEMPLATES.keys())
+
+
 def get_template(name: str) -> Dict:
     """
     Get a pre-built pathway template by name.
@@ -150,7 +178,7 @@ def get_template(name: str) -> Dict:
     Returns
     -------
     dict
-        Template with nodes and edges.
+        Template with nodes and edges. A fresh copy, safe to modify.
 
     Raises
     ------
@@ -158,9 +186,13 @@ def get_template(name: str) -> Dict:
         If template name is not found.
     """
     if name not in TEMPLATES:
-        available = ', '.join(TEMPLATES.keys())
-        raise ValueError(f"Template '{name}' not found. Available: {available}")
-    return TEMPLATES[name]
+        raise ValueError(f"Template '{name}' not found. Available: {_TEMPLATE_NAMES}")
+    template = TEMPLATES[name]
+    return {
+        **template,
+        'nodes': [dict(n) for n in template['nodes']],
+        'edges': [dict(e) for e in template['edges']],
+    }
 
 
 def list_templates() -> List[Dict]:
@@ -172,14 +204,4 @@ def list_templates() -> List[Dict]:
     list
         List of template metadata dictionaries.
     """
-    return [
-        {
-            'id': t['id'],
-            'name': t['name'],
-            'organism': t['organism'],
-            'description': t['description'],
-            'node_count': len(t['nodes']),
-            'edge_count': len(t['edges'])
-        }
-        for t in TEMPLATES.values()
-    ]
+    return [dict(t) for t in _TEMPLATE_INDEX]
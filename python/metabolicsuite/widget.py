@@ -6,16 +6,25 @@ Uses anywidget for modern Jupyter widget development with React frontend.
 
 import json
 import pathlib
-from typing import Any, Dict, List, Optional, Union
+import re
+from collections import Counter
+from itertools import chain, compress
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import anywidget
 import traitlets
-import numpy as np
-import pandas as pd
+
+# numpy and pandas are imported by the methods that use them, so importing
+# the widget does not pay for them
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Path to bundled frontend assets
 _STATIC_DIR = pathlib.Path(__file__).parent / "static"
 
+# Cytosol/extracellular suffix dropped from metabolite ids used as labels
+_COMPARTMENT_SUFFIX_RE = re.compile(r'_[ce]$')
+
 
 class PathwayMap(anywidget.AnyWidget):
     """
@@ -117,17 +126,19 @@ class PathwayMap(anywidget.AnyWidget):
 
     def _load_model(self, model: Any) -> None:
         """Load model from various sources."""
-        # Try COBRApy model
-        if hasattr(model, 'reactions') and hasattr(model, 'metabolites'):
-            self._load_cobra_model(model)
-        # Dictionary
-        elif isinstance(model, dict):
-            self._load_dict_model(model)
-        # File path
-        elif isinstance(model, (str, pathlib.Path)):
-            self._load_file_model(model)
-        else:
-            raise TypeError(f"Unsupported model type: {type(model)}")
+        # model_data, nodes and edges go to the frontend in one message
+        with self.hold_sync():
+            # Try COBRApy model
+            if hasattr(model, 'reactions') and hasattr(model, 'metabolites'):
+                self._load_cobra_model(model)
+            # Dictionary
+            elif isinstance(model, dict):
+                self._load_dict_model(model)
+            # File path
+            elif isinstance(model, (str, pathlib.Path)):
+                self._load_file_model(model)
+            else:
+                raise TypeError(f"Unsupported model type: {type(model)}")
 
     def _load_cobra_model(self, model: Any) -> None:
         """Load from COBRApy model object."""
@@ -185,13 +196,17 @@ class PathwayMap(anywidget.AnyWidget):
         if not path.exists():
             raise FileNotFoundError(f"Model file not found: {path}")
 
-        content = path.read_text()
-
         if path.suffix.lower() in ['.xml', '.sbml']:
-            # SBML - would need to parse
-            raise NotImplementedError("SBML parsing in Python widget not yet implemented. Use web interface.")
+            # SBML is read by COBRApy's libsbml-backed reader
+            try:
+                from cobra.io import read_sbml_model
+            except ImportError:
+                raise ImportError(
+                    "Loading SBML files requires COBRApy: pip install metabolicsuite[cobra]"
+                ) from None
+            self._load_cobra_model(read_sbml_model(str(path)))
         elif path.suffix.lower() == '.json':
-            model = json.loads(content)
+            model = json.loads(path.read_text())
             self._load_dict_model(model)
         else:
             raise ValueError(f"Unsupported file format: {path.suffix}")
@@ -200,34 +215,40 @@ class PathwayMap(anywidget.AnyWidget):
         """Load a pre-built pathway template."""
         from .templates import get_template
         template = get_template(template_name)
-        self.nodes = template['nodes']
-        self.edges = template['edges']
-        self.model_data = {'id': template['id'], 'name': template['name']}
+        with self.hold_sync():
+            self.nodes = template['nodes']
+            self.edges = template['edges']
+            self.model_data = {'id': template['id'], 'name': template['name']}
 
     def _generate_layout(self) -> None:
         """Generate automatic layout for visualization."""
+        import numpy as np
+
         reactions = self.model_data.get('reactions', {})
         metabolites = self.model_data.get('metabolites', {})
 
         # Track metabolite connectivity
-        connectivity = {}
-        for rxn in reactions.values():
-            for met_id in rxn.get('metabolites', {}).keys():
-                connectivity[met_id] = connectivity.get(met_id, 0) + 1
-
-        # Get top connected metabolites
-        sorted_mets = sorted(connectivity.items(), key=lambda x: -x[1])[:30]
+        connectivity = Counter(chain.from_iterable(
+            rxn.get('metabolites', {}) for rxn in reactions.values()
+        ))
+
+        # Get top connected metabolites (ties keep first-seen order)
+        sorted_mets = connectivity.most_common(30)
+
+        # Generate spiral layout: the angle advances 0.8 rad per node and the
+        # radius grows by 20 px every 5 nodes
+        n = len(sorted_mets)
+        steps = np.full(n, 0.8)
+        steps[:1] = 0.0
+        angles = np.cumsum(steps)
+        radii = 100 + (np.arange(n) // 5) * 20
+        xs = (self.width / 2 + radii * np.cos(angles)).tolist()
+        ys = (self.height / 2 + radii * np.sin(angles)).tolist()
 
-        # Generate spiral layout
         nodes = []
-        angle = 0
-        radius = 100
-        width, height = self.width, self.height
-
-        for i, (met_id, count) in enumerate(sorted_mets):
+        for (met_id, count), x, y in zip(sorted_mets, xs, ys):
             met = metabolites.get(met_id, {})
-            x = width / 2 + radius * np.cos(angle)
-            y = height / 2 + radius * np.sin(angle)
+            label = met['name'] if 'name' in met else _COMPARTMENT_SUFFIX_RE.sub('', met_id)
 
             node_type = 'metabolite'
             if met_id.endswith('_e'):
@@ -237,25 +258,32 @@ class PathwayMap(anywidget.AnyWidget):
 
             nodes.append({
                 'id': met_id,
-                'x': float(x),
-                'y': float(y),
-                'label': met.get('name', met_id.replace('_c', '').replace('_e', '')),
+                'x': x,
+                'y': y,
+                'label': label,
                 'type': node_type,
                 'connectivity': count
             })
 
-            angle += 0.8
-            if i % 5 == 4:
-                radius += 20
-
-        # Generate edges
+        # Generate edges between key metabolites, stopping once the edge cap
+        # below is reached
         edges = []
-        key_mets = set(m[0] for m in sorted_mets)
+        key_mets = frozenset(m[0] for m in sorted_mets)
 
         for rxn_id, rxn in reactions.items():
-            mets = rxn.get('metabolites', {})
-            reactants = [m for m, c in mets.items() if c < 0 and m in key_mets]
-            products = [m for m, c in mets.items() if c > 0 and m in key_mets]
+            if len(edges) >= 50:
+                break
+            # Split key metabolites into reactants/products in one scan
+            reactants = []
+            products = []
+            for m, c in rxn.get('metabolites', {}).items():
+                if m in key_mets:
+                    if c < 0:
+                        reactants.append(m)
+                    elif c > 0:
+                        products.append(m)
+            if not reactants or not products:
+                continue
 
             for r in reactants:
                 for p in products:
@@ -279,9 +307,17 @@ class PathwayMap(anywidget.AnyWidget):
         fluxes : dict or pandas.Series
             Mapping of reaction IDs to flux values.
         """
+        import numpy as np
+
         if hasattr(fluxes, 'to_dict'):
-            fluxes = fluxes.to_dict()
-        self.fluxes = {k: float(v) for k, v in fluxes.items() if not np.isnan(v)}
+            ids = fluxes.index.tolist()
+            values = fluxes.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            ids = list(fluxes)
+            values = np.fromiter(fluxes.values(), dtype=np.float64, count=len(ids))
+        # Drop NaN fluxes with one mask instead of a per-value isnan call
+        keep = ~np.isnan(values)
+        self.fluxes = dict(zip(compress(ids, keep), values[keep].tolist()))
 
     def add_transcriptomics(
         self,
@@ -384,12 +420,13 @@ class PathwayMap(anywidget.AnyWidget):
         condition: Optional[str]
     ) -> None:
         """Internal method to add omics data."""
+        import numpy as np
+        import pandas as pd
+
         if isinstance(data, pd.DataFrame):
-            indexed = {}
-            for _, row in data.iterrows():
-                id_val = str(row[id_col])
-                indexed[id_val] = {value_col: float(row[value_col])}
-            data = indexed
+            ids = data[id_col].astype(str).tolist()
+            values = data[value_col].to_numpy(dtype=np.float64).tolist()
+            data = {id_val: {value_col: v} for id_val, v in zip(ids, values)}
         elif isinstance(data, dict):
             if all(isinstance(v, (int, float)) for v in data.values()):
                 data = {k: {value_col: v} for k, v in data.items()}
@@ -402,12 +439,14 @@ class PathwayMap(anywidget.AnyWidget):
             'conditions': [condition or value_col],
             'selectedCondition': condition or value_col
         }
-        self.omics_data = omics
 
         # Enable visualization
         settings = dict(self.vis_settings)
         settings[omics_type] = {**settings.get(omics_type, {}), 'enabled': True}
-        self.vis_settings = settings
+
+        with self.hold_sync():
+            self.omics_data = omics
+            self.vis_settings = settings
 
     def set_vis_setting(self, omics_type: str, **kwargs) -> None:
         """
@@ -478,6 +517,8 @@ class OmicsOverlay:
         dict
             Prepared data for PathwayMap.add_transcriptomics().
         """
+        import pandas as pd
+
         df = pd.read_csv(filepath)
         return {
             'data': df,
@@ -502,6 +543,8 @@ class OmicsOverlay:
         dict
             Prepared data for PathwayMap.add_proteomics().
         """
+        import pandas as pd
+
         df = pd.read_csv(filepath, sep='\t')
         # Find LFQ intensity columns
         lfq_cols = [c for c in df.columns if 'LFQ intensity' in c]
@@ -529,6 +572,8 @@ class OmicsOverlay:
         dict
             Prepared data for PathwayMap.add_metabolomics().
         """
+        import pandas as pd
+
         df = pd.read_csv(filepath)
         # MetaboAnalyst typically has compound IDs in first column
         id_col = df.columns[0]
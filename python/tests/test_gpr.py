@@ -0,0 +1,110 @@
+"""CompiledGPRs must agree with evaluate_gpr_expression on every rule."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from metabolicsuite import api
+
+
+def _deep_rule(depth):
+    """Alternate AND/OR so the nesting survives flattening to n-ary nodes"""
+    rule = "g1"
+    for k in range(depth):
+        op = "and" if k % 2 else "or"
+        rule = f"({rule} {op} g{k % 3 + 2})"
+    return rule
+
+
+RULES = [
+    "g1",
+    "g1 and g2",
+    "g1 or g2",
+    "g1 and g2 or g3",
+    "(g1 or g2) and g3",
+    "g1 and (g2 or g3) and g4",
+    "((g1))",
+    "g1 or unmeasured",
+    "unmeasured and g2",
+    "b0001.1 and GENE_2-3:a",
+    _deep_rule(150),
+    _deep_rule(1500),
+    # Rejected by the character prefilter
+    "g1 and g2;",
+    "g1 & g2",
+    "g1 | g2",
+    # Rejected by the parser
+    "g1 or (g2 and g3",
+    "g1 and g2)",
+    "g1 and",
+    "or g1",
+    "g1 g2",
+]
+
+EXPRESSION = {
+    "g1": 0.2, "g2": 0.5, "g3": 0.7, "g4": 0.1,
+    "b0001.1": 0.9, "GENE_2-3:a": 0.3,
+}
+
+# Raw counts and log2 fold changes are not 0-1 normalized; min/max must stay exact
+UNNORMALIZED = [
+    {"g1": 5.0, "g2": 3.0, "g3": 12.5, "g4": 2.0, "b0001.1": 7.0, "GENE_2-3:a": 4.0},
+    {"g1": -1.0, "g2": -2.0, "g3": -0.5, "g4": -3.0, "b0001.1": -1.5, "GENE_2-3:a": -4.0},
+    {"g1": -1.5, "g2": 2.5, "g3": 0.0, "g4": 1.0, "b0001.1": -0.2, "GENE_2-3:a": 3.0},
+]
+
+
+def _model(rules):
+    """Just enough of a COBRApy model for compile_gprs; skips cobra's own GPR checks"""
+    reactions = [
+        SimpleNamespace(id=f"R{i}", gene_reaction_rule=rule) for i, rule in enumerate(rules)
+    ]
+    return SimpleNamespace(reactions=reactions)
+
+
+@pytest.fixture(params=["kernel", "bytecode"])
+def compiled(request, monkeypatch):
+    if request.param == "bytecode":
+        monkeypatch.setattr(api, "_get_gpr_kernel", lambda: None)
+    elif api._get_gpr_kernel() is None:
+        pytest.skip("numba not installed")
+    return api.compile_gprs(_model(RULES))
+
+
+@pytest.mark.parametrize("expression", [EXPRESSION] + UNNORMALIZED)
+def test_matches_evaluate_gpr_expression(compiled, expression):
+    result = compiled.evaluate(expression)
+    for i, rule in enumerate(RULES):
+        assert result[f"R{i}"] == api.evaluate_gpr_expression(rule, expression), rule
+
+
+def test_unnormalized_values_are_not_clamped():
+    assert api.evaluate_gpr_expression("a and b", {"a": 5.0, "b": 3.0}) == 3.0
+    assert api.evaluate_gpr_expression("a or b", {"a": 5.0, "b": 3.0}) == 5.0
+    assert api.evaluate_gpr_expression("a or b", {"a": -1.0, "b": -2.0}) == -1.0
+    assert api.evaluate_gpr_expression("a and b", {"a": -1.0, "b": -2.0}) == -2.0
+
+
+def test_prefilter_failures_are_constitutive(compiled):
+    result = compiled.evaluate(EXPRESSION)
+    for rule in ("g1 and g2;", "g1 & g2", "g1 | g2"):
+        assert result[f"R{RULES.index(rule)}"] == 1.0
+        assert api.evaluate_gpr_expression(rule, EXPRESSION) == 1.0
+
+
+def test_prefilter_raises_gpr_parse_error():
+    with pytest.raises(api.GPRParseError, match="Unexpected characters"):
+        api._gpr_to_postfix("g1 and g2;", {})
+
+
+def test_blank_rules_are_skipped():
+    compiled = api.compile_gprs(_model(["", "   ", "g1"]))
+    assert compiled.rxn_ids == ["R2"]
+    assert compiled.evaluate({}) == {"R2": 1.0}
+
+
+def test_reused_across_profiles(compiled):
+    for expression in ({}, {"g1": 0.0}, {g: 1.0 - v for g, v in EXPRESSION.items()}):
+        result = compiled.evaluate(expression)
+        for i, rule in enumerate(RULES):
+            assert result[f"R{i}"] == api.evaluate_gpr_expression(rule, expression), rule
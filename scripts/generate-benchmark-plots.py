@@ -10,7 +10,9 @@ Usage:
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 
@@ -31,7 +33,12 @@ rcParams['axes.titlesize'] = 12
 rcParams['legend.fontsize'] = 9
 rcParams['figure.dpi'] = 150
 rcParams['savefig.dpi'] = 300
-rcParams['savefig.bbox'] = 'tight'
+# No savefig.bbox='tight': every plot calls tight_layout() once, and the tight
+# bbox would add a measuring draw to each of the PDF and PNG saves
+
+# Scatter plots with more points than this are rasterized in the PDFs;
+# smaller ones stay vector so publication figures remain crisp
+RASTERIZE_MIN_POINTS = 5000
 
 
 def load_results(filepath):
@@ -45,37 +52,86 @@ def load_results(filepath):
         return data, {}
 
 
-def plot_objective_correlation(results, output_dir):
-    """Scatter plot: HiGHS vs COBRApy objective values"""
-    fig, ax = plt.subplots(figsize=(5, 5))
-
+def extract_plot_data(results, summary):
+    """Collect the arrays every plot needs in a single pass over results"""
     highs_objs = []
     cobra_objs = []
-    passed = []
+    obj_passed = []
+    obj_diffs = []
+    highs_times = []
+    cobra_times = []
+    passed_count = 0
 
     for r in results:
+        is_passed = r.get('passed', False)
+        if is_passed:
+            passed_count += 1
         if r.get('highs_obj') is not None and r.get('cobra_obj') is not None:
             highs_objs.append(abs(r['highs_obj']))
             cobra_objs.append(abs(r['cobra_obj']))
-            passed.append(r.get('passed', False))
+            obj_passed.append(is_passed)
+        if r.get('obj_diff') is not None:
+            obj_diffs.append(r['obj_diff'])
+        if r.get('highs_time_ms'):
+            highs_times.append(r['highs_time_ms'])
+        if r.get('cobra_time_ms'):
+            cobra_times.append(r['cobra_time_ms'])
+
+    if summary and 'highsTime' in summary:
+        highs_mean = summary['highsTime'].get('mean', 0)
+        cobra_mean = summary['cobraTime'].get('mean', 0)
+    else:
+        # Calculate from results
+        highs_mean = np.mean(highs_times) if highs_times else 0
+        cobra_mean = np.mean(cobra_times) if cobra_times else 0
 
-    if not highs_objs:
+    log_diffs = None
+    if obj_diffs:
+        # Log-transform in place (add small epsilon to avoid log(0))
+        log_diffs = np.array(obj_diffs, dtype=np.float64)
+        log_diffs += 1e-16
+        np.log10(log_diffs, out=log_diffs)
+
+    return {
+        'objectives': (np.array(highs_objs), np.array(cobra_objs), np.array(obj_passed))
+                      if highs_objs else None,
+        'log_diffs': log_diffs,
+        'mean_times': (highs_mean, cobra_mean),
+        'pass_counts': (passed_count, len(results) - passed_count),
+    }
+
+
+def _color_error_bins(counts, edges, patches):
+    """Color histogram bars by tolerance band"""
+    for i, (count, patch) in enumerate(zip(counts, patches)):
+        bin_center = (edges[i] + edges[i + 1]) / 2
+        if bin_center < -6:
+            patch.set_facecolor('#22c55e')  # Green - excellent
+        elif bin_center < -3:
+            patch.set_facecolor('#eab308')  # Yellow - good
+        else:
+            patch.set_facecolor('#ef4444')  # Red - above tolerance
+
+
+def plot_objective_correlation(data, output_dir):
+    """Scatter plot: HiGHS vs COBRApy objective values"""
+    if data['objectives'] is None:
         print("No objective data to plot")
         return
+    highs_objs, cobra_objs, passed = data['objectives']
 
-    highs_objs = np.array(highs_objs)
-    cobra_objs = np.array(cobra_objs)
-    passed = np.array(passed)
+    fig, ax = plt.subplots(figsize=(5, 5))
 
     # Plot diagonal reference
-    max_val = max(max(highs_objs), max(cobra_objs))
+    max_val = max(highs_objs.max(), cobra_objs.max())
     ax.plot([0, max_val], [0, max_val], 'k--', alpha=0.5, label='Perfect agreement')
 
     # Plot points
-    ax.scatter(highs_objs[passed], cobra_objs[passed],
-               c='#22c55e', alpha=0.7, s=40, label='Passed', edgecolors='white', linewidth=0.5)
-    ax.scatter(highs_objs[~passed], cobra_objs[~passed],
-               c='#ef4444', alpha=0.7, s=40, label='Failed', edgecolors='white', linewidth=0.5)
+    rasterized = len(highs_objs) > RASTERIZE_MIN_POINTS
+    ax.scatter(highs_objs[passed], cobra_objs[passed], c='#22c55e', alpha=0.7, s=40,
+               label='Passed', edgecolors='white', linewidth=0.5, rasterized=rasterized)
+    ax.scatter(highs_objs[~passed], cobra_objs[~passed], c='#ef4444', alpha=0.7, s=40,
+               label='Failed', edgecolors='white', linewidth=0.5, rasterized=rasterized)
 
     ax.set_xlabel('HiGHS WASM Objective Value')
     ax.set_ylabel('COBRApy (GLPK) Objective Value')
@@ -89,36 +145,22 @@ def plot_objective_correlation(results, output_dir):
     fig.savefig(output_dir / 'objective_correlation.pdf')
     fig.savefig(output_dir / 'objective_correlation.png')
     plt.close(fig)
-    print(f"Saved objective correlation plot")
+    print("Saved objective correlation plot")
 
 
-def plot_error_distribution(results, output_dir):
+def plot_error_distribution(data, output_dir):
     """Histogram: Distribution of objective differences (log scale)"""
-    fig, ax = plt.subplots(figsize=(6, 4))
-
-    obj_diffs = [r['obj_diff'] for r in results if r.get('obj_diff') is not None]
-
-    if not obj_diffs:
+    if data['log_diffs'] is None:
         print("No objective diff data to plot")
         return
 
-    # Log-transform (add small epsilon to avoid log(0))
-    log_diffs = np.log10(np.array(obj_diffs) + 1e-16)
+    fig, ax = plt.subplots(figsize=(6, 4))
 
     # Create histogram
     bins = np.linspace(-16, 0, 17)
-    counts, edges, patches = ax.hist(log_diffs, bins=bins, color='#3b82f6',
+    counts, edges, patches = ax.hist(data['log_diffs'], bins=bins, color='#3b82f6',
                                       edgecolor='white', alpha=0.8)
-
-    # Color by tolerance
-    for i, (count, patch) in enumerate(zip(counts, patches)):
-        bin_center = (edges[i] + edges[i + 1]) / 2
-        if bin_center < -6:
-            patch.set_facecolor('#22c55e')  # Green - excellent
-        elif bin_center < -3:
-            patch.set_facecolor('#eab308')  # Yellow - good
-        else:
-            patch.set_facecolor('#ef4444')  # Red - above tolerance
+    _color_error_bins(counts, edges, patches)
 
     # Add tolerance line
     ax.axvline(x=-6, color='#dc2626', linestyle='--', linewidth=2,
@@ -133,22 +175,14 @@ def plot_error_distribution(results, output_dir):
     fig.savefig(output_dir / 'error_distribution.pdf')
     fig.savefig(output_dir / 'error_distribution.png')
     plt.close(fig)
-    print(f"Saved error distribution plot")
+    print("Saved error distribution plot")
 
 
-def plot_solve_time_comparison(results, summary, output_dir):
+def plot_solve_time_comparison(data, output_dir):
     """Bar chart: Solve time comparison"""
     fig, ax = plt.subplots(figsize=(5, 4))
 
-    if summary and 'highsTime' in summary:
-        highs_mean = summary['highsTime'].get('mean', 0)
-        cobra_mean = summary['cobraTime'].get('mean', 0)
-    else:
-        # Calculate from results
-        highs_times = [r['highs_time_ms'] for r in results if r.get('highs_time_ms')]
-        cobra_times = [r['cobra_time_ms'] for r in results if r.get('cobra_time_ms')]
-        highs_mean = np.mean(highs_times) if highs_times else 0
-        cobra_mean = np.mean(cobra_times) if cobra_times else 0
+    highs_mean, cobra_mean = data['mean_times']
 
     solvers = ['HiGHS\nWASM', 'COBRApy\n(GLPK)']
     times = [highs_mean, cobra_mean]
@@ -176,15 +210,14 @@ def plot_solve_time_comparison(results, summary, output_dir):
     fig.savefig(output_dir / 'solve_time_comparison.pdf')
     fig.savefig(output_dir / 'solve_time_comparison.png')
     plt.close(fig)
-    print(f"Saved solve time comparison plot")
+    print("Saved solve time comparison plot")
 
 
-def plot_pass_rate_pie(results, output_dir):
+def plot_pass_rate_pie(data, output_dir):
     """Pie chart: Pass/fail summary"""
     fig, ax = plt.subplots(figsize=(5, 5))
 
-    passed = sum(1 for r in results if r.get('passed', False))
-    failed = len(results) - passed
+    passed, failed = data['pass_counts']
 
     sizes = [passed, failed]
     labels = [f'Passed\n({passed})', f'Failed\n({failed})']
@@ -206,34 +239,25 @@ def plot_pass_rate_pie(results, output_dir):
     fig.savefig(output_dir / 'pass_rate.pdf')
     fig.savefig(output_dir / 'pass_rate.png')
     plt.close(fig)
-    print(f"Saved pass rate plot")
+    print("Saved pass rate plot")
 
 
-def plot_combined_figure(results, summary, output_dir):
+def plot_combined_figure(data, output_dir):
     """Create a combined 2x2 figure for publication"""
     fig, axes = plt.subplots(2, 2, figsize=(10, 9))
 
     # 1. Objective correlation (top-left)
     ax = axes[0, 0]
-    highs_objs = []
-    cobra_objs = []
-    passed = []
+    if data['objectives'] is not None:
+        highs_objs, cobra_objs, passed = data['objectives']
 
-    for r in results:
-        if r.get('highs_obj') is not None and r.get('cobra_obj') is not None:
-            highs_objs.append(abs(r['highs_obj']))
-            cobra_objs.append(abs(r['cobra_obj']))
-            passed.append(r.get('passed', False))
-
-    if highs_objs:
-        highs_objs = np.array(highs_objs)
-        cobra_objs = np.array(cobra_objs)
-        passed = np.array(passed)
-
-        max_val = max(max(highs_objs), max(cobra_objs))
+        max_val = max(highs_objs.max(), cobra_objs.max())
         ax.plot([0, max_val], [0, max_val], 'k--', alpha=0.5, label='y=x')
-        ax.scatter(highs_objs[passed], cobra_objs[passed], c='#22c55e', alpha=0.6, s=30, label='Passed')
-        ax.scatter(highs_objs[~passed], cobra_objs[~passed], c='#ef4444', alpha=0.6, s=30, label='Failed')
+        rasterized = len(highs_objs) > RASTERIZE_MIN_POINTS
+        ax.scatter(highs_objs[passed], cobra_objs[passed], c='#22c55e', alpha=0.6, s=30,
+                   label='Passed', rasterized=rasterized)
+        ax.scatter(highs_objs[~passed], cobra_objs[~passed], c='#ef4444', alpha=0.6, s=30,
+                   label='Failed', rasterized=rasterized)
         ax.set_xlabel('HiGHS Objective')
         ax.set_ylabel('COBRApy Objective')
         ax.set_title('A. Objective Correlation')
@@ -242,19 +266,11 @@ def plot_combined_figure(results, summary, output_dir):
 
     # 2. Error distribution (top-right)
     ax = axes[0, 1]
-    obj_diffs = [r['obj_diff'] for r in results if r.get('obj_diff') is not None]
-    if obj_diffs:
-        log_diffs = np.log10(np.array(obj_diffs) + 1e-16)
+    if data['log_diffs'] is not None:
         bins = np.linspace(-16, 0, 17)
-        counts, edges, patches = ax.hist(log_diffs, bins=bins, color='#3b82f6', edgecolor='white', alpha=0.8)
-        for i, (count, patch) in enumerate(zip(counts, patches)):
-            bin_center = (edges[i] + edges[i + 1]) / 2
-            if bin_center < -6:
-                patch.set_facecolor('#22c55e')
-            elif bin_center < -3:
-                patch.set_facecolor('#eab308')
-            else:
-                patch.set_facecolor('#ef4444')
+        counts, edges, patches = ax.hist(data['log_diffs'], bins=bins, color='#3b82f6',
+                                         edgecolor='white', alpha=0.8)
+        _color_error_bins(counts, edges, patches)
         ax.axvline(x=-6, color='#dc2626', linestyle='--', linewidth=2, label='Tolerance')
         ax.set_xlabel(r'$\log_{10}(|\Delta obj|)$')
         ax.set_ylabel('Count')
@@ -263,15 +279,7 @@ def plot_combined_figure(results, summary, output_dir):
 
     # 3. Solve time (bottom-left)
     ax = axes[1, 0]
-    if summary and 'highsTime' in summary:
-        highs_mean = summary['highsTime'].get('mean', 0)
-        cobra_mean = summary['cobraTime'].get('mean', 0)
-    else:
-        highs_times = [r['highs_time_ms'] for r in results if r.get('highs_time_ms')]
-        cobra_times = [r['cobra_time_ms'] for r in results if r.get('cobra_time_ms')]
-        highs_mean = np.mean(highs_times) if highs_times else 0
-        cobra_mean = np.mean(cobra_times) if cobra_times else 0
-
+    highs_mean, cobra_mean = data['mean_times']
     bars = ax.bar(['HiGHS', 'COBRApy'], [highs_mean, cobra_mean],
                   color=['#3b82f6', '#8b5cf6'], edgecolor='white', width=0.5)
     for bar, time in zip(bars, [highs_mean, cobra_mean]):
@@ -282,9 +290,7 @@ def plot_combined_figure(results, summary, output_dir):
 
     # 4. Pass rate (bottom-right)
     ax = axes[1, 1]
-    passed_count = sum(1 for r in results if r.get('passed', False))
-    failed_count = len(results) - passed_count
-    ax.pie([passed_count, failed_count], labels=['Passed', 'Failed'],
+    ax.pie(list(data['pass_counts']), labels=['Passed', 'Failed'],
            colors=['#22c55e', '#ef4444'], autopct='%1.1f%%', startangle=90,
            textprops={'fontsize': 10})
     ax.set_title('D. Validation Summary')
@@ -293,7 +299,7 @@ def plot_combined_figure(results, summary, output_dir):
     fig.savefig(output_dir / 'validation_combined.pdf')
     fig.savefig(output_dir / 'validation_combined.png')
     plt.close(fig)
-    print(f"Saved combined figure")
+    print("Saved combined figure")
 
 
 def main():
@@ -318,12 +324,27 @@ def main():
     output_dir = results_dir / 'plots'
     output_dir.mkdir(exist_ok=True)
 
-    # Generate plots
-    plot_objective_correlation(results, output_dir)
-    plot_error_distribution(results, output_dir)
-    plot_solve_time_comparison(results, summary, output_dir)
-    plot_pass_rate_pie(results, output_dir)
-    plot_combined_figure(results, summary, output_dir)
+    # Generate plots from one extraction pass
+    data = extract_plot_data(results, summary)
+    plot_funcs = [
+        plot_objective_correlation,
+        plot_error_distribution,
+        plot_solve_time_comparison,
+        plot_pass_rate_pie,
+        plot_combined_figure,
+    ]
+
+    # Each figure is independent, so render them in separate processes
+    # when there is more than one core
+    workers = min(len(plot_funcs), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, data, output_dir) for func in plot_funcs]
+            for future in futures:
+                future.result()
+    else:
+        for func in plot_funcs:
+            func(data, output_dir)
 
     print(f"\nAll plots saved to: {output_dir}")
 